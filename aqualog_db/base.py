@@ -3,8 +3,8 @@
 """
 base.py – Core Database Repository Class
 
-Provides the `BaseRepository` class, which manages thread-local SQLite
-database connections. This is the foundation that all specific repository classes
+Provides the `BaseRepository` class, which manages pooled SQLite database
+connections. This is the foundation that all specific repository classes
 inherit from to interact with the database safely and consistently.
 """
 
@@ -13,25 +13,29 @@ from __future__ import annotations # Added for type hinting consistency
 import os
 import sqlite3
 import threading
-import atexit
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Iterable, Set
 
-from config import DB_FILE
+from .connection import checkout_connection, release_connection
 
 class BaseRepository:
     """
-    Base class for repository implementations, managing thread-local SQLite
+    Base class for repository implementations, managing pooled SQLite
     database connections.
 
-    It ensures that each thread has its own database connection, handles connection
-    setup (row factory, PRAGMAs), and manages connection cleanup upon program exit.
+    Connections come from the pool in `connection.py`, shared with
+    `get_connection()`, where they are opened and configured (row factory,
+    foreign keys, PRAGMAs) once. A thread checks one out for its outermost
+    `_connection()` block, so nested blocks share it, and hands it back when
+    that block exits. Streamlit runs every rerun on a new thread, so this
+    reuses warm connections where a per-thread connection would be opened (and
+    leaked) on each rerun.
     """
 
-    # Stores thread-local data, particularly the SQLite connection for the current thread.
+    # Stores thread-local data: the connection checked out by the current
+    # thread and how many `_connection()` blocks are currently using it.
     _local: threading.local = threading.local()
-    # A set to keep track of all active BaseRepository instances for proper cleanup
-    # of their thread-local connections when the application exits.
+    # A set to keep track of all active BaseRepository instances.
     _instances: Set['BaseRepository'] = set()
 
     def __init__(self):
@@ -40,25 +44,16 @@ class BaseRepository:
         """
         self.__class__._instances.add(self)
 
-    @classmethod
-    def _cleanup_all(cls) -> None:
-        """
-        Class method to close all active thread-local database connections across
-        all BaseRepository instances when the program exits. This method is
-        registered with `atexit` to ensure proper resource release.
-        """
-        for instance in cls._instances:
-            instance.close_connection()
-
     @contextmanager
     def _connection(self) -> sqlite3.Connection:
         """
         Provides a context-managed SQLite database connection for the current thread.
 
-        If a connection does not exist for the current thread, it establishes a new one,
-        sets the row factory to `sqlite3.Row` for dict-like access, and applies necessary
-        PRAGMA statements (e.g., enforcing foreign key constraints). It also handles
-        transaction rollbacks on any exceptions that occur within the context block.
+        The outermost block on a thread checks a connection out of the pool (opening
+        a new one if the pool is empty); nested blocks reuse it. When the outermost
+        block exits, any uncommitted work is rolled back and the connection returns
+        to the pool. It also handles transaction rollbacks on any exceptions that
+        occur within the context block.
 
         Yields:
             sqlite3.Connection: A configured database connection object ready for use.
@@ -68,45 +63,36 @@ class BaseRepository:
                           during connection setup or while executing operations within
                           the context, preventing the connection from being used reliably.
         """
-        if not getattr(self._local, 'conn', None):
-            conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-            conn.row_factory = sqlite3.Row # Allows accessing columns by name
-            conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
-            
-            # Removed PRAGMA journal_mode = WAL; and PRAGMA synchronous = NORMAL;
-            # as per previous instructions to avoid deployment environment errors.
-            
+        conn = getattr(self._local, 'conn', None)
+        if not conn:
+            conn = checkout_connection()
             self._local.conn = conn
+            self._local.depth = 0
+        self._local.depth += 1
 
         try:
-            yield self._local.conn
+            yield conn
         except sqlite3.Error as e:
             # Rollback any pending transaction on SQLite errors
-            self._local.conn.rollback()
+            conn.rollback()
             raise RuntimeError(f"Database error: {e}") from e
         except Exception as e:
             # Catch other unexpected errors and rollback
-            self._local.conn.rollback()
+            conn.rollback()
             raise RuntimeError(f"Unexpected error: {e}") from e
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                self._local.conn = None
+                release_connection(conn)
 
     def close_connection(self) -> None:
         """
-        Closes the thread-local database connection if it is currently open.
-        Any active transaction on this connection will be rolled back to
-        prevent data inconsistencies before the connection is closed.
+        Kept for callers of the old per-thread connections; it does nothing now.
+        A repository holds no connection of its own: the one checked out by a
+        `_connection()` block goes back to the shared pool when the block
+        exits, and `connection.close_all_connections()` closes idle ones at exit.
         """
-        conn = getattr(self._local, 'conn', None)
-        if conn:
-            try:
-                # If there's an active transaction, roll it back to prevent data inconsistencies
-                if conn.in_transaction:
-                    conn.rollback()
-                conn.close()
-            except sqlite3.Error:
-                # Ignore errors during closing if the connection is already broken
-                pass
-            finally:
-                self._local.conn = None # Clear the connection from thread-local storage
 
     def execute(self, sql: str, params: Iterable[Any] = ()) -> None:
         """
@@ -213,7 +199,3 @@ class BaseRepository:
                 return row[0] if row else None # Return the first column of the first row
             except sqlite3.Error as e:
                 raise RuntimeError(f"Database error: {e}") from e
-
-# Ensure all connections are cleaned up when the Python interpreter exits.
-# This prevents database locks and ensures proper resource release.
-atexit.register(BaseRepository._cleanup_all)
\ No newline at end of file
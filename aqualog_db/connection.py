@@ -6,35 +6,195 @@ connection.py – Database Connection Manager
 A simple module that provides a managed `sqlite3.Connection` to the project's
 `aqualog.db` database file, ensuring a consistent and safe connection context
 for all database operations.
+
+Connections are kept in a small process-wide pool instead of being opened and
+closed for every query, so the per-connection PRAGMAs are applied only once
+and SQLite's page cache stays warm between calls. `get_connection()` and
+`BaseRepository` (through `checkout_connection()`/`release_connection()`)
+share that one pool. Read-only queries can use a
+separate pool of `query_only` connections via `get_reader_connection()`; in
+WAL mode those reads neither wait for nor block the writers.
 """
 
 from __future__ import annotations
+import atexit
+import os
+import queue
 import sqlite3
 from contextlib import contextmanager
 
 # Import the DB_FILE constant from your central configuration
 from config import DB_FILE
 
+# Maximum number of idle connections kept for reuse. Checkouts never block:
+# when the pool is empty a new connection is opened, and connections returned
+# to a full pool are closed.
+POOL_SIZE = 5
+# Idle connections kept in the read-only pool, one per CPU.
+READER_POOL_SIZE = os.cpu_count() or 4
+
+# Applied once to every new connection by `configure_connection`. journal_mode
+# is handled separately there because some filesystems cannot host a WAL
+# database.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -64000;",  # Negative values are KiB, so ~64 MB
+    "PRAGMA mmap_size = 268435456;",  # 256 MB
+    "PRAGMA busy_timeout = 5000;",
+)
+
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=POOL_SIZE)
+_reader_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=READER_POOL_SIZE)
+
+
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """
+    Switches the database to WAL journaling where possible and applies
+    `CONNECTION_PRAGMAS` to a newly opened pooled connection.
+
+    Args:
+        conn (sqlite3.Connection): The connection to configure.
+    """
+    try:
+        conn.execute("PRAGMA journal_mode = WAL;")
+    except sqlite3.Error:
+        # Keep the default rollback journal where WAL is unavailable
+        # (e.g. network or read-only filesystems).
+        pass
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _open_connection(query_only: bool = False) -> sqlite3.Connection:
+    """
+    Opens and configures a new connection for a pool.
+
+    Args:
+        query_only (bool): Whether to open the connection with `PRAGMA query_only`,
+                           so that any attempt to write through it fails.
+
+    Returns:
+        sqlite3.Connection: A connection with type parsing, `sqlite3.Row` rows,
+                            foreign key enforcement and the pool PRAGMAs applied.
+    """
+    # Connect with type parsing and row factory for dict-like access.
+    # Pooled connections may be checked out by different Streamlit threads
+    # (one at a time), so the same-thread check is disabled.
+    conn = sqlite3.connect(
+        DB_FILE,  # Use the imported DB_FILE constant
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+    configure_connection(conn)
+    if query_only:
+        conn.execute("PRAGMA query_only = 1;")
+    return conn
+
+
+def _release(conn: sqlite3.Connection, pool: "queue.LifoQueue[sqlite3.Connection]") -> None:
+    """
+    Returns a connection to the pool, discarding any uncommitted work first so
+    the next user starts from a clean state. Broken connections and connections
+    that do not fit in the pool are closed instead.
+    """
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.row_factory = sqlite3.Row
+        pool.put_nowait(conn)
+    except (sqlite3.Error, queue.Full):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+def checkout_connection() -> sqlite3.Connection:
+    """
+    Takes a connection out of the shared pool, opening a new one if the pool
+    is empty. Every checkout must be paired with `release_connection()`;
+    `get_connection()` does both around a `with` block.
+
+    Returns:
+        sqlite3.Connection: A configured database connection object.
+    """
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return _open_connection()
+
+
+def release_connection(conn: sqlite3.Connection) -> None:
+    """
+    Hands a connection from `checkout_connection()` back to the shared pool.
+    Uncommitted work is rolled back first, as closing the connection would.
+
+    Args:
+        conn (sqlite3.Connection): The connection to return.
+    """
+    _release(conn, _pool)
+
+
 @contextmanager
 def get_connection() -> sqlite3.Connection:
     """
     Provides a context-managed `sqlite3.Connection` to the project's `aqualog.db` file.
 
     This ensures the correct database path is used regardless of the current
-    working directory. It also configures the connection for type parsing,
-    dict-like row access, and strict foreign key enforcement. The connection
-    is automatically closed upon exiting the context.
+    working directory. It also configures the connection for type parsing and
+    dict-like row access. The connection is checked out of the shared pool and
+    handed back upon exiting the context; anything not committed by then is
+    rolled back, just as closing the connection would have done.
 
     Yields:
         sqlite3.Connection: A configured database connection object.
     """
-    # Connect with type parsing and row factory for dict-like access
-    conn = sqlite3.connect(
-        DB_FILE,  # Use the imported DB_FILE constant
-        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-    )
-    conn.row_factory = sqlite3.Row
+    conn = checkout_connection()
     try:
         yield conn
     finally:
-        conn.close()
\ No newline at end of file
+        release_connection(conn)
+
+
+@contextmanager
+def get_reader_connection() -> sqlite3.Connection:
+    """
+    Provides a context-managed, read-only `sqlite3.Connection` from the reader
+    pool. It is configured like `get_connection()` but runs with
+    `PRAGMA query_only = 1`, so it must only be used for SELECT queries.
+
+    Yields:
+        sqlite3.Connection: A configured read-only database connection object.
+    """
+    try:
+        conn = _reader_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(query_only=True)
+    try:
+        yield conn
+    finally:
+        _release(conn, _reader_pool)
+
+
+def close_all_connections() -> None:
+    """
+    Closes every idle connection held by the pools. Registered with `atexit`,
+    and safe to call at any time; connections currently checked out are closed
+    when they are returned to a full pool or garbage collected.
+    """
+    for pool in (_pool, _reader_pool):
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+atexit.register(close_all_connections)
@@ -113,6 +113,9 @@ class CustomRangeRepository(BaseRepository):
                     (tank_id, parameter)
                 )
                 conn.commit()
+                # Custom ranges are cached on the water test repository's hot read path.
+                from .water_test import WaterTestRepository
+                WaterTestRepository._invalidate_read_cache()
                 return saved_range
             except sqlite3.IntegrityError as e:
                 conn.rollback()
@@ -143,12 +146,19 @@ class CustomRangeRepository(BaseRepository):
         """
         self._validate_tank_id(tank_id)
         
-        ranges = self.fetch_all(
-            "SELECT parameter, safe_low, safe_high FROM custom_ranges WHERE tank_id = ?;",
-            (tank_id,)
-        )
-        # Convert list of dicts to a single dictionary {parameter: (low, high)}
-        return {r['parameter']: (r['safe_low'], r['safe_high']) for r in ranges}
+        with self._connection() as conn:
+            # Plain tuples from a cursor without the Row factory unpack
+            # positionally into {parameter: (low, high)}.
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            try:
+                cursor.execute(
+                    "SELECT parameter, safe_low, safe_high FROM custom_ranges WHERE tank_id = ?;",
+                    (tank_id,)
+                )
+                return {parameter: (low, high) for parameter, low, high in cursor.fetchall()}
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Database error: {e}") from e
 
     def _validate_tank_id(self, tank_id: int) -> None:
         """
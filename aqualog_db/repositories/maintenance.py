@@ -85,7 +85,8 @@ class MaintenanceRepository(BaseRepository):
             notes (Optional[str]): Optional additional notes about the maintenance.
                                    Stored as `None` if an empty string.
             next_due (Optional[str]): Optional calculated next due date for the maintenance
-                                      in ISO format (YYYY-MM-DD).
+                                      in ISO format (YYYY-MM-DD). When `cycle_id` is given
+                                      it is replaced by `date` plus the cycle's frequency.
             cycle_id (Optional[int]): Optional ID of the associated recurring maintenance cycle,
                                       linking this log entry to a defined schedule. Defaults to `None`.
 
@@ -94,24 +95,33 @@ class MaintenanceRepository(BaseRepository):
             RuntimeError: If a general operational error occurs in the BaseRepository.
         """
         with get_connection() as conn:
+            # Entries logged against a cycle are due again `frequency_days`
+            # after this one, which overrides any `next_due` passed in.
             conn.execute(
                 """
                 INSERT INTO maintenance_log (
                     tank_id, date, maintenance_type, description,
                     volume_changed, cost, notes, next_due, cycle_id
-                ) VALUES (?,?,?,?,?,?,?,?,?);
+                ) VALUES (
+                    :tank_id, :date, :m_type, :description,
+                    :volume_changed, :cost, :notes,
+                    CASE WHEN :cycle_id IS NULL THEN :next_due
+                         ELSE date(:date, '+' || (SELECT frequency_days FROM maintenance_cycles WHERE id = :cycle_id) || ' days')
+                    END,
+                    :cycle_id
+                );
                 """,
-                (
-                    tank_id,
-                    date,
-                    m_type.strip(), # Ensure type is stripped of whitespace
-                    description.strip() if description else None, # Store None if empty string
-                    volume_changed,
-                    cost,
-                    notes.strip() if notes else None, # Store None if empty string
-                    next_due,
-                    cycle_id
-                ),
+                {
+                    "tank_id": tank_id,
+                    "date": date,
+                    "m_type": m_type.strip(), # Ensure type is stripped of whitespace
+                    "description": description.strip() if description else None, # Store None if empty string
+                    "volume_changed": volume_changed,
+                    "cost": cost,
+                    "notes": notes.strip() if notes else None, # Store None if empty string
+                    "next_due": next_due,
+                    "cycle_id": cycle_id,
+                },
             )
             conn.commit()
 
@@ -169,12 +179,15 @@ class MaintenanceRepository(BaseRepository):
             conn.execute("DELETE FROM maintenance_log WHERE id = ?;", (record_id,))
             conn.commit()
 
-    def fetch_maintenance_cycles(self, tank_id: int) -> List[MaintenanceCycleRecord]: # Updated return type
+    def fetch_maintenance_cycles(self, tank_id: int, active_only: bool = False) -> List[MaintenanceCycleRecord]: # Updated return type
         """
         Retrieves all defined recurring maintenance cycles for a specific tank.
 
         Args:
             tank_id (int): The ID of the tank to fetch maintenance cycles for.
+            active_only (bool): If `True`, only cycles with `is_active` set are returned,
+                                read through the partial index on active cycles.
+                                Defaults to `False`.
 
         Returns:
             List[MaintenanceCycleRecord]: A list of dictionaries, where each dictionary
@@ -188,14 +201,17 @@ class MaintenanceRepository(BaseRepository):
             sqlite3.Error: If a database error occurs during fetching.
             RuntimeError: If a general operational error occurs in the BaseRepository.
         """
+        # The literal `is_active = 1` must appear in the query for SQLite to
+        # use the partial index, so it is not bound as a parameter.
+        active_filter = " AND is_active = 1" if active_only else ""
         with get_connection() as conn:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
-                """
+                f"""
                 SELECT id, maintenance_type as type, created_at as date,
                        notes, frequency_days, is_active
                 FROM maintenance_cycles
-                WHERE tank_id = ?
+                WHERE tank_id = ?{active_filter}
                 ORDER BY datetime(created_at) DESC;
                 """,
                 (tank_id,),
@@ -101,19 +101,37 @@ class TankRepository(BaseRepository):
                 conn.rollback()
                 raise RuntimeError(f"Database error: {str(e)}") from e
 
-    def rename(self, tank_id: int, new_name: str) -> TankRecord:
+    def update(self, tank_id: int, **fields: Any) -> TankRecord:
         """
-        Renames an existing tank in the database.
+        Updates one or more columns of an existing tank in a single statement.
+
+        Grouped edits (e.g. name, volume and CO2 status saved together from the
+        settings panel) therefore cost one transaction instead of one per field.
+
+        Args:
+            tank_id (int): The unique identifier of the tank.
+            **fields: Column values to set. Supported keys are `name`, `volume_l`,
+                      `start_date`, `notes`, `has_co2`, `co2_on_hour` and `co2_off_hour`.
+
+        Returns:
+            TankRecord: The updated tank record.
+
+        Raises:
+            ValueError: If a field is unknown or its value fails validation.
+            RuntimeError: If a database error occurs.
         """
         self._validate_tank_id(tank_id)
-        self._validate_name(new_name)
-        
+        if not fields:
+            raise ValueError("No tank fields given to update")
+        values = {field: self._validate_update_field(field, value) for field, value in fields.items()}
+
+        assignments = ", ".join([*(f"{field} = ?" for field in values), "updated_at = datetime('now')"])
         with self._connection() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute(
-                    "UPDATE tanks SET name = ? WHERE id = ?;",
-                    (new_name.strip(), tank_id)
+                    f"UPDATE tanks SET {assignments} WHERE id = ?;",
+                    (*values.values(), tank_id)
                 )
                 updated_tank = self.fetch_one(
                     "SELECT * FROM tanks WHERE id = ?;",
@@ -124,12 +142,18 @@ class TankRepository(BaseRepository):
             except sqlite3.IntegrityError as e:
                 conn.rollback()
                 if "CHECK" in str(e):
-                    raise ValueError(f"Invalid tank name: {str(e)}")
+                    raise ValueError(f"Invalid tank data: {str(e)}")
                 raise RuntimeError(f"Database error: {str(e)}") from e
             except sqlite3.Error as e:
                 conn.rollback()
                 raise RuntimeError(f"Database error: {str(e)}") from e
 
+    def rename(self, tank_id: int, new_name: str) -> TankRecord:
+        """
+        Renames an existing tank in the database.
+        """
+        return self.update(tank_id, name=new_name)
+
     def remove(self, tank_id: int) -> None:
         """
         Deletes a tank and all its related records from the database.
@@ -138,8 +162,14 @@ class TankRepository(BaseRepository):
         
         with self._connection() as conn:
             try:
+                # Take the write lock up front so the tank row and every
+                # ON DELETE CASCADE child row are removed in one commit.
+                conn.execute("BEGIN IMMEDIATE;")
                 conn.execute("DELETE FROM tanks WHERE id = ?;", (tank_id,))
                 conn.commit()
+                # The cascade removes the tank's water tests and custom ranges.
+                from .water_test import WaterTestRepository
+                WaterTestRepository._invalidate_read_cache()
             except sqlite3.Error as e:
                 conn.rollback()
                 raise RuntimeError(f"Database error: {str(e)}") from e
@@ -148,72 +178,21 @@ class TankRepository(BaseRepository):
         """
         Updates the volume of an existing tank.
         """
-        self._validate_tank_id(tank_id)
-        
         if not isinstance(volume_l, (int, float)) or volume_l < 0:
             raise ValueError("Tank volume must be a non-negative number")
-        
-        with self._connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    "UPDATE tanks SET volume_l = ? WHERE id = ?;",
-                    (float(volume_l), tank_id)
-                )
-                updated_tank = self.fetch_one(
-                    "SELECT * FROM tanks WHERE id = ?;",
-                    (tank_id,)
-                )
-                conn.commit()
-                return TankRecord(updated_tank) if updated_tank else None
-            except sqlite3.Error as e:
-                conn.rollback()
-                raise RuntimeError(f"Database error: {str(e)}") from e
+        return self.update(tank_id, volume_l=volume_l)
 
     def set_co2_schedule(self, tank_id: int, on_hour: Optional[int], off_hour: Optional[int]) -> TankRecord:
         """
         Sets the custom CO2 ON and OFF hours for a specific tank.
         """
-        self._validate_tank_id(tank_id)
-        if on_hour is not None and not (0 <= on_hour <= 23):
-            raise ValueError("CO2 ON hour must be between 0 and 23.")
-        if off_hour is not None and not (0 <= off_hour <= 23):
-            raise ValueError("CO2 OFF hour must be between 0 and 23.")
-        
-        with self._connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    "UPDATE tanks SET co2_on_hour = ?, co2_off_hour = ? WHERE id = ?;",
-                    (on_hour, off_hour, tank_id)
-                )
-                updated_tank = self.fetch_one(
-                    "SELECT * FROM tanks WHERE id = ?;",
-                    (tank_id,)
-                )
-                conn.commit()
-                return TankRecord(updated_tank) if updated_tank else None
-            except sqlite3.Error as e:
-                conn.rollback()
-                raise RuntimeError(f"Database error: {str(e)}") from e
+        return self.update(tank_id, co2_on_hour=on_hour, co2_off_hour=off_hour)
 
     def set_co2_status(self, tank_id: int, has_co2: bool) -> None:
         """
         Sets the CO2 usage status for a specific tank.
         """
-        self._validate_tank_id(tank_id)
-        
-        with self._connection() as conn:
-            try:
-                conn.execute(
-                    "UPDATE tanks SET has_co2 = ? WHERE id = ?;",
-                    (has_co2, tank_id)
-                )
-                conn.commit()
-            except sqlite3.Error as e:
-                conn.rollback()
-                raise RuntimeError(f"Database error: {str(e)}") from e
-
+        self.update(tank_id, has_co2=has_co2)
 
     def get_by_id(self, tank_id: int) -> Optional[TankRecord]:
         """
@@ -236,6 +215,33 @@ class TankRepository(BaseRepository):
             if not isinstance(volume_l, (int, float)) or volume_l < 0:
                 raise ValueError("Tank volume must be None or a non-negative number")
 
+    def _validate_update_field(self, field: str, value: Any) -> Any:
+        """
+        Internal helper method to validate and normalize a single field passed to `update`.
+        """
+        if field == "name":
+            self._validate_name(value)
+            return value.strip()
+        if field == "volume_l":
+            if value is not None and (not isinstance(value, (int, float)) or value < 0):
+                raise ValueError("Tank volume must be None or a non-negative number")
+            return float(value) if value is not None else None
+        if field == "has_co2":
+            return bool(value)
+        if field in ("co2_on_hour", "co2_off_hour"):
+            # bool is an int subclass, but True is not an hour.
+            if value is not None and (
+                not isinstance(value, int) or isinstance(value, bool) or not (0 <= value <= 23)
+            ):
+                label = "ON" if field == "co2_on_hour" else "OFF"
+                raise ValueError(f"CO2 {label} hour must be an integer between 0 and 23.")
+            return value
+        if field in ("start_date", "notes"):
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"Tank {field} must be a string or None")
+            return value.strip() if value else None
+        raise ValueError(f"Unknown tank field: {field}")
+
     def _validate_name(self, name: str) -> None:
         """
         Internal helper method to validate a tank name.
@@ -9,11 +9,16 @@ ranges and tank IDs. It also incorporates validation logic for water parameters.
 """
 
 from __future__ import annotations
-from datetime import datetime
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional, List, Any, Tuple, TypedDict
+from typing import Dict, Optional, List, Any, Mapping, Tuple, TypedDict
 import sqlite3
-from aqualog_db.connection import get_connection
+from aqualog_db.connection import get_connection, get_reader_connection
+from config import DB_FILE
 from ..base import BaseRepository
 
 # Define a TypedDict for the structure of a water test record.
@@ -31,6 +36,116 @@ class WaterTestRecord(TypedDict, total=False):
     gh: Optional[float]
     tank_id: int
     notes: Optional[str]
+    date_epoch: Optional[int]
+
+def _db_stamp() -> Tuple[int, int]:
+    """
+    Returns the modification times of the database file and its WAL file. It is
+    passed as part of the cache key for hot reads so that writes made by another
+    process (which cannot clear this process's caches) still expire stale
+    entries. In WAL mode commits only touch the `-wal` file until a checkpoint.
+    """
+    stamps = []
+    for path in (DB_FILE, f"{DB_FILE}-wal"):
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return stamps[0], stamps[1]
+
+def _iso_to_epoch(value: str) -> int:
+    """
+    Converts an ISO 8601 date string to Unix seconds for the `date_epoch`
+    column. Naive values are read as UTC wall-clock time, matching SQLite's
+    `strftime('%s', date)` used to backfill existing rows, so converting back
+    with `pd.to_datetime(..., unit='s')` reproduces the stored date.
+
+    Raises:
+        ValueError: If `value` is not an ISO 8601 date.
+    """
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+# `date_epoch` for reads, falling back to the ISO text (converted the same
+# way the migration backfills it) for rows written without an epoch.
+_EPOCH_SQL = "COALESCE(date_epoch, CAST(strftime('%s', date) AS INTEGER))"
+
+@lru_cache(maxsize=1024)
+def _validate_numeric(field: str, raw_value: Any, min_val: int, max_val: int) -> Optional[float]:
+    """
+    Returns `raw_value` as a float within `min_val`..`max_val`, or `None`
+    when it is missing or blank. Memoized, since the form re-submits the
+    same readings over and over.
+
+    Raises:
+        ValueError: If the value is not numeric or is out of range.
+    """
+    if raw_value is None or raw_value == '':
+        return None
+    try:
+        value = float(raw_value)
+    except (ValueError, TypeError):
+        value = None
+    if value is None or not (min_val <= value <= max_val):
+        raise ValueError(f"Invalid value for {field} ('{raw_value}') - must be a number between {min_val} and {max_val}.")
+    return value
+
+def _coerce(field: str, raw_value: Any, min_val: int, max_val: int) -> Optional[float]:
+    """
+    Validates one parameter through the `_validate_numeric` cache, falling back
+    to an uncached call for unhashable values.
+    """
+    try:
+        return _validate_numeric(field, raw_value, min_val, max_val)
+    except TypeError:
+        return _validate_numeric.__wrapped__(field, raw_value, min_val, max_val)
+
+# SQLite extended result codes for the constraint failures save() reports as
+# bad input (sqlite3 exposes them as constants from Python 3.11).
+_SQLITE_CONSTRAINT_CHECK = getattr(sqlite3, "SQLITE_CONSTRAINT_CHECK", 275)
+_SQLITE_CONSTRAINT_FOREIGNKEY = getattr(sqlite3, "SQLITE_CONSTRAINT_FOREIGNKEY", 787)
+
+def _integrity_error(e: sqlite3.IntegrityError) -> Exception:
+    """
+    Maps an `IntegrityError` from a water test insert to the exception the
+    repository raises, classifying it by its SQLite error code. Python
+    versions without `sqlite_errorcode` fall back to the message text.
+    """
+    code = getattr(e, "sqlite_errorcode", None)
+    if code is None:
+        is_check, is_foreign_key = "CHECK" in str(e), "FOREIGN KEY" in str(e)
+    else:
+        is_check, is_foreign_key = code == _SQLITE_CONSTRAINT_CHECK, code == _SQLITE_CONSTRAINT_FOREIGNKEY
+    if is_check:
+        return ValueError(f"Invalid parameter value: {e}")
+    if is_foreign_key:
+        return ValueError("Invalid tank ID: tank does not exist.")
+    return RuntimeError(f"Database error: {e}")
+
+# INSERT statements keyed by the column tuple they bind and the number of
+# VALUES groups. Every insert binds `WaterTestRepository._COLUMNS`, so
+# in practice this holds one single-row statement plus the multi-row one used
+# by save_many; identical SQL text also keeps sqlite3's statement cache hitting.
+_INSERT_SQL: Dict[Tuple[Tuple[str, ...], int], str] = {}
+
+# Rows folded into one multi-row INSERT by save_many, kept under SQLite's
+# default limit of 999 bound parameters per statement.
+_INSERT_CHUNK_ROWS = 50
+_MAX_SQL_PARAMS = 999
+
+def _insert_sql(columns: Tuple[str, ...], rows: int = 1) -> str:
+    """
+    Returns the parameterized INSERT statement for the given column tuple with
+    `rows` VALUES groups, building and memoizing it on first use.
+    """
+    sql = _INSERT_SQL.get((columns, rows))
+    if sql is None:
+        group = "(" + ", ".join("?" for _ in columns) + ")"
+        sql = f"INSERT INTO water_tests ({', '.join(columns)}) VALUES {', '.join([group] * rows)}"
+        _INSERT_SQL[(columns, rows)] = sql
+    return sql
 
 class WaterTestRepository(BaseRepository):
     """
@@ -50,126 +165,428 @@ class WaterTestRepository(BaseRepository):
         "kh": (0, 30),
         "gh": (0, 30)
     }
+    # Column order and broadcastable bounds used by the vectorized bulk validator.
+    PARAM_ORDER: Tuple[str, ...] = tuple(VALID_PARAMETERS)
+    _PARAM_MIN: np.ndarray = np.array([lo for lo, _ in VALID_PARAMETERS.values()], dtype=np.float64)
+    _PARAM_MAX: np.ndarray = np.array([hi for _, hi in VALID_PARAMETERS.values()], dtype=np.float64)
+    # (field, min, max) triples walked by `_prepare_payload`, and the column
+    # order of the tuple it returns, which is also the column list of every
+    # INSERT. Together they cover every `water_tests` column except `id`.
+    _VALID_PARAMS_TUPLE: Tuple[Tuple[str, int, int], ...] = tuple(
+        (field, lo, hi) for field, (lo, hi) in VALID_PARAMETERS.items()
+    )
+    _COLUMNS: Tuple[str, ...] = ("date", *PARAM_ORDER, "co2_indicator", "tank_id", "notes", "date_epoch")
+    # Column names and dtypes of the `fetch_by_date_range` frame, whose `date`
+    # column is rebuilt from `date_epoch`.
+    _FRAME_COLUMNS: Tuple[str, ...] = (
+        "id", "date", "ph", "ammonia", "nitrite", "nitrate", "temperature",
+        "kh", "co2_indicator", "gh", "tank_id", "notes",
+    )
+    _FRAME_DTYPES: Dict[str, str] = {"id": "int64", "tank_id": "int64", **{p: "float64" for p in PARAM_ORDER}}
 
     def save(self, data: WaterTestRecord, tank_id: int = 1) -> WaterTestRecord:
         """
         Saves a new water test record to the database after validation.
         """
-        self._validate_input(dict(data), tank_id)
-        payload: WaterTestRecord = self._prepare_payload(data, tank_id)
+        self._validate_input(data, tank_id)
+        row = self._prepare_payload(data, tank_id)
 
         with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(water_tests);")
-            valid_columns = {row['name'] for row in cursor.fetchall()}
-            filtered_payload = {k: v for k, v in payload.items() if k in valid_columns}
             
             # Use parameterized query to prevent SQL injection
-            columns = ", ".join(filtered_payload.keys())
-            placeholders = ", ".join("?" for _ in filtered_payload)
-            sql = f"INSERT INTO water_tests ({columns}) VALUES ({placeholders})"
+            sql = _insert_sql(self._COLUMNS)
             
             try:
-                cursor.execute(sql, tuple(filtered_payload.values()))
+                cursor.execute(sql, row)
                 inserted_id = cursor.lastrowid
                 conn.commit()
+                type(self)._invalidate_read_cache()
             except sqlite3.IntegrityError as e:
                 conn.rollback()
-                if "CHECK" in str(e):
-                    raise ValueError(f"Invalid parameter value: {e}")
-                if "FOREIGN KEY" in str(e):
-                    raise ValueError("Invalid tank ID: tank does not exist.")
+                raise _integrity_error(e)
+            except sqlite3.Error as e:
+                conn.rollback()
                 raise RuntimeError(f"Database error: {e}")
+
+        # Every column was bound explicitly, so the stored row is exactly
+        # `row` plus the id SQLite assigned; no need to read it back.
+        return WaterTestRecord(zip(("id", *self._COLUMNS), (inserted_id, *row)))
+
+    def save_many(self, records: List[WaterTestRecord], tank_id: int = 1) -> int:
+        """
+        Saves many water test records for one tank in a single transaction.
+
+        Each record goes through the same checks as `save`, except that the
+        numeric parameters of the whole batch are range-checked in one
+        vectorized pass by `_validate_bulk`. Rows are written in multi-row
+        INSERT statements of up to
+        `_INSERT_CHUNK_ROWS` rows, with any remainder sent through
+        `executemany`, and everything is committed once at the end.
+
+        Args:
+            records (List[WaterTestRecord]): The water test records to insert.
+            tank_id (int): The ID of the tank all records belong to. Defaults to 1.
+
+        Returns:
+            int: The number of records inserted.
+
+        Raises:
+            ValueError: If any record fails validation or violates a constraint;
+                        nothing is inserted in that case.
+            RuntimeError: If a database error occurs.
+        """
+        if not records:
+            return 0
+
+        # Each record is validated once, and the tank is looked up once for
+        # the whole batch rather than per record.
+        for record in records:
+            self._validate_input(record, tank_id, check_tank=False)
+        from .tank import TankRepository
+        if not TankRepository().get_by_id(tank_id):
+            raise ValueError(f"Tank with ID {tank_id} does not exist.")
+
+        values, missing = self._validate_bulk(records)
+        # Only missing readings are bound as NULL, like save() does.
+        params = np.where(missing, None, values).tolist()
+        rows = [self._prepare_payload(record, tank_id, p) for record, p in zip(records, params)]
+
+        columns = self._COLUMNS
+        with get_connection() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute("BEGIN;")
+                chunk = max(1, min(_INSERT_CHUNK_ROWS, _MAX_SQL_PARAMS // len(columns)))
+                full = len(rows) - len(rows) % chunk
+                if full:
+                    sql = _insert_sql(columns, chunk)
+                    for start in range(0, full, chunk):
+                        cursor.execute(sql, [v for row in rows[start:start + chunk] for v in row])
+                if full < len(rows):
+                    cursor.executemany(_insert_sql(columns), rows[full:])
+                conn.commit()
+                type(self)._invalidate_read_cache()
+            except sqlite3.IntegrityError as e:
+                conn.rollback()
+                raise _integrity_error(e)
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise RuntimeError(f"Database error: {e}")
+
+        return len(rows)
+
+    def delete_for_tank(self, tank_id: int) -> int:
+        """
+        Deletes every water test recorded for a tank.
+
+        Args:
+            tank_id (int): The ID of the tank whose tests are deleted.
+
+        Returns:
+            int: The number of tests deleted.
+
+        Raises:
+            ValueError: If `tank_id` is not a positive integer.
+            RuntimeError: If a database error occurs.
+        """
+        if not isinstance(tank_id, int) or tank_id < 1:
+            raise ValueError("Invalid tank ID: must be positive integer")
+        with get_connection() as conn:
+            try:
+                deleted = conn.execute("DELETE FROM water_tests WHERE tank_id = ?;", (tank_id,)).rowcount
+                conn.commit()
+                type(self)._invalidate_read_cache()
             except sqlite3.Error as e:
                 conn.rollback()
                 raise RuntimeError(f"Database error: {e}")
+        return deleted
+
+    def replace_from_frame(self, df: pd.DataFrame, tank_id: int) -> int:
+        """
+        Imports water tests for a tank from a DataFrame, as the CSV import
+        does. Existing tests of the tank on any of the frame's dates are
+        replaced, in a single transaction.
+
+        Args:
+            df (pd.DataFrame): The tests to import. Its columns must be
+                               `water_tests` columns, including `date`.
+            tank_id (int): The ID of the tank the tests belong to.
+
+        Returns:
+            int: The number of tests imported.
 
+        Raises:
+            ValueError: If `tank_id` is not a positive integer, or a row
+                        violates a constraint.
+            RuntimeError: If a database error occurs.
+        """
+        if not isinstance(tank_id, int) or tank_id < 1:
+            raise ValueError("Invalid tank ID: must be positive integer")
         with get_connection() as conn:
-            result = self.fetch_one("SELECT * FROM water_tests WHERE id = ?;", (inserted_id,))
-            return WaterTestRecord(result) if result else None
+            try:
+                conn.executemany(
+                    "DELETE FROM water_tests WHERE date = ? AND tank_id = ?;",
+                    [(d, tank_id) for d in df["date"].unique()],
+                )
+                df.to_sql("water_tests", conn, if_exists="append", index=False)
+                conn.commit()
+                type(self)._invalidate_read_cache()
+            except sqlite3.IntegrityError as e:
+                conn.rollback()
+                raise _integrity_error(e)
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise RuntimeError(f"Database error: {e}")
+        return len(df)
 
-    def _validate_input(self, data: dict, tank_id: int) -> None:
+    def _validate_input(self, data: Mapping[str, Any], tank_id: int, check_tank: bool = True) -> None:
         """
-        Performs initial, high-level validation on the raw input data dictionary
-        and the tank ID.
+        Performs initial, high-level validation on the raw input mapping and
+        the tank ID. The mapping is only read, so callers pass their record
+        as-is rather than a copy. `check_tank=False` skips the tank lookup for
+        batches whose tank has already been checked.
         """
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             raise ValueError("Data must be a dictionary")
         if not isinstance(tank_id, int) or tank_id < 1:
             raise ValueError("Invalid tank ID: must be positive integer")
         
-        from .tank import TankRepository
-        if not TankRepository().get_by_id(tank_id):
-            raise ValueError(f"Tank with ID {tank_id} does not exist.")
+        if check_tank:
+            from .tank import TankRepository
+            if not TankRepository().get_by_id(tank_id):
+                raise ValueError(f"Tank with ID {tank_id} does not exist.")
 
         if 'date' in data and not isinstance(data['date'], str):
             raise ValueError("Date must be a string (ISO format expected).")
-        if 'co2_indicator' in data and data['co2_indicator'] not in self.VALID_CO2_INDICATORS:
+        # None means "no reading", which the form sends for tanks without CO2.
+        co2_indicator = data.get('co2_indicator')
+        if co2_indicator is not None and co2_indicator not in self.VALID_CO2_INDICATORS:
             raise ValueError(f"CO2 indicator must be one of {self.VALID_CO2_INDICATORS}")
 
-    def _prepare_payload(self, data: WaterTestRecord, tank_id: int) -> WaterTestRecord:
+    def _prepare_payload(
+        self, data: Mapping[str, Any], tank_id: int, params: Optional[List[Optional[float]]] = None
+    ) -> Tuple[Any, ...]:
         """
-        Prepares the raw input data into a standardized payload dictionary
-        suitable for database insertion.
+        Converts the raw input data into the row tuple bound by the INSERT,
+        ordered as `_COLUMNS`. Parameters are coerced to floats and range
+        checked; blank values, missing parameters and blank notes become NULL.
+        The input dictionary is not modified.
+
+        `params` supplies parameter values (in `PARAM_ORDER`) that have already
+        been validated, as `save_many` does in bulk; they are used as-is.
         """
-        payload = data.copy()
-        payload['tank_id'] = tank_id
-        payload.setdefault("date", datetime.now().isoformat(timespec="seconds"))
-        
-        for field, (min_val, max_val) in self.VALID_PARAMETERS.items():
-            if field in payload:
-                raw_value = payload[field]
-                if raw_value is None or raw_value == '':
-                    payload[field] = None
-                    continue
-                
-                try:
-                    value = float(raw_value)
-                    if not (min_val <= value <= max_val):
-                        raise ValueError(f"{field} ({value}) is outside acceptable range ({min_val} to {max_val}).")
-                    payload[field] = value
-                except (ValueError, TypeError):
-                    raise ValueError(f"Invalid value for {field} ('{raw_value}') - must be a number between {min_val} and {max_val}.")
-            else:
-                payload.setdefault(field, None)
-                
-        if 'notes' in payload and (payload['notes'] is None or payload['notes'].strip() == ''):
-            payload['notes'] = None
-        elif 'notes' in payload:
-            payload['notes'] = payload['notes'].strip()
-
-        return payload
+        date = data["date"] if "date" in data else datetime.now().isoformat(timespec="seconds")
+        notes = data.get("notes")
+        if notes is not None:
+            notes = notes.strip() or None
+        try:
+            date_epoch = _iso_to_epoch(date)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid date ('{date}') - ISO format expected.")
+        if params is None:
+            params = [_coerce(field, data.get(field), lo, hi) for field, lo, hi in self._VALID_PARAMS_TUPLE]
+        return (
+            date,
+            *params,
+            data.get("co2_indicator"),
+            tank_id,
+            notes,
+            date_epoch,
+        )
+
+    def _validate_bulk(self, payloads: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Range-checks the numeric parameters of many records in one vectorized pass,
+        for bulk ingestion paths where per-value `float()` calls and comparisons
+        would dominate.
+
+        Builds a `(rows, len(PARAM_ORDER))` float array and compares it against
+        the `VALID_PARAMETERS` bounds at once. Only `None` and `''` count as
+        missing, as in `save`; any other value that is not a finite number in
+        range (including NaN or the string "nan") is rejected.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The validated float array, columns in
+            `PARAM_ORDER`, and a boolean mask of the missing values (NaN in the array).
+
+        Raises:
+            ValueError: If any value is non-numeric or outside its acceptable range.
+        """
+        missing = np.array(
+            [[p.get(k) is None or p.get(k) == '' for k in self.PARAM_ORDER] for p in payloads],
+            dtype=bool,
+        ).reshape(len(payloads), len(self.PARAM_ORDER))
+        try:
+            arr = np.array(
+                [[np.nan if m else p.get(k) for k, m in zip(self.PARAM_ORDER, row)]
+                 for p, row in zip(payloads, missing)],
+                dtype=np.float64,
+            ).reshape(len(payloads), len(self.PARAM_ORDER))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid water parameter value in batch - all parameters must be numbers: {e}") from e
+
+        bad = ~missing & (~np.isfinite(arr) | (arr < self._PARAM_MIN) | (arr > self._PARAM_MAX))
+        if bad.any():
+            problems = []
+            for row in np.argwhere(bad.any(axis=1)).ravel()[:5]:
+                for col in np.flatnonzero(bad[row]):
+                    field = self.PARAM_ORDER[col]
+                    min_val, max_val = self.VALID_PARAMETERS[field]
+                    problems.append(f"row {row + 1}: {field} ({arr[row, col]}) outside {min_val} to {max_val}")
+            raise ValueError("Values outside acceptable range: " + "; ".join(problems))
+        return arr, missing
 
     def fetch_by_date_range(self, start: str, end: str, tank_id: Optional[int] = None) -> pd.DataFrame:
         """
         Fetches water test records within a specified date range for a given tank.
         """
-        if not isinstance(start, str) or not isinstance(end, str):
-            raise ValueError("Start and end dates must be strings")
-        
-        query = """
-            SELECT id, date, ph, ammonia, nitrite, nitrate, temperature,
+        # Compare the integer `date_epoch` copy instead of the ISO text; it is
+        # also what the frame's `date` column is rebuilt from.
+        query, params = self._date_range_query(
+            f"""
+            SELECT id, {_EPOCH_SQL}, ph, ammonia, nitrite, nitrate, temperature,
                    kh, co2_indicator, gh, tank_id, notes
             FROM water_tests
-            WHERE date BETWEEN ? AND ?
+            """,
+            start, end, tank_id
+        )
+        
+        try:
+            with get_reader_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+            df = pd.DataFrame.from_records(rows, columns=self._FRAME_COLUMNS)
+            # Same nanosecond dtype as the frame parsed from the ISO text had.
+            df["date"] = pd.to_datetime(df["date"].astype("int64"), unit="s").astype("datetime64[ns]")
+            return df.astype(self._FRAME_DTYPES)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch data: {e}") from e
+
+    def fetch_by_date_range_arrays(
+        self, start: str, end: str, tank_id: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Fetches the same records as `fetch_by_date_range` as plain NumPy columns,
+        for callers that only need arrays (charting, rolling statistics) and
+        would otherwise pay for building a DataFrame.
+
+        Returns:
+            Dict[str, np.ndarray]: `id` and `tank_id` (int64), `date`
+                                   (datetime64[s]) and one float64 array per
+                                   parameter in `PARAM_ORDER`, with NaN for
+                                   missing readings. The arrays are column views
+                                   of a single block, ordered by date.
+
+        Raises:
+            ValueError: If the dates or `tank_id` are invalid.
+            RuntimeError: If a database error occurs.
+        """
+        query, params = self._date_range_query(
+            f"SELECT id, tank_id, {_EPOCH_SQL}, {', '.join(self.PARAM_ORDER)} FROM water_tests",
+            start, end, tank_id
+        )
+        try:
+            with get_reader_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                rows = cursor.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error: {e}") from e
+
+        # NULL readings become NaN; id, tank_id and epoch seconds are exact in
+        # float64, so one block holds every column before the casts below.
+        block = np.array(rows, dtype=np.float64).reshape(len(rows), 3 + len(self.PARAM_ORDER))
+        arrays: Dict[str, np.ndarray] = {
+            "id": block[:, 0].astype(np.int64),
+            "tank_id": block[:, 1].astype(np.int64),
+            "date": block[:, 2].astype(np.int64).astype("datetime64[s]"),
+        }
+        for i, field in enumerate(self.PARAM_ORDER, start=3):
+            arrays[field] = block[:, i]
+        return arrays
+
+    @staticmethod
+    def _date_range_query(
+        select_sql: str, start: str, end: str, tank_id: Optional[int]
+    ) -> Tuple[str, List[Any]]:
         """
-        params: List[Any] = [start, end]
+        Validates the arguments of the date range fetches and appends the
+        `date_epoch` range filter, optional tank filter and date ordering to
+        `select_sql`.
+
+        Returns:
+            Tuple[str, List[Any]]: The full query and its parameters.
+
+        Raises:
+            ValueError: If the dates are not ISO strings or `tank_id` is invalid.
+        """
+        if not isinstance(start, str) or not isinstance(end, str):
+            raise ValueError("Start and end dates must be strings")
         
+        try:
+            params: List[Any] = [_iso_to_epoch(start), _iso_to_epoch(end)]
+        except ValueError:
+            raise ValueError("Start and end dates must be ISO format strings")
+
+        # Rows without an epoch are matched on their converted ISO text, so
+        # the indexed `date_epoch` comparison still serves every other row.
+        query = select_sql.rstrip() + (
+            " WHERE (date_epoch BETWEEN ? AND ?"
+            f" OR (date_epoch IS NULL AND {_EPOCH_SQL} BETWEEN ? AND ?))"
+        )
+        params += params
         if tank_id is not None:
             if not isinstance(tank_id, int) or tank_id < 1:
                 raise ValueError("Invalid tank ID")
             query += " AND tank_id = ?"
             params.append(tank_id)
         
-        query += " ORDER BY date ASC"
-        
+        query += f" ORDER BY {_EPOCH_SQL} ASC"
+        return query, params
+
+    def fetch_daily_summary(self, start: str, end: str, tank_id: int) -> pd.DataFrame:
+        """
+        Fetches the per-day rollup of a tank's water tests between two dates,
+        one row per day that has tests, from the `water_tests_daily` table.
+
+        Args:
+            start (str): ISO date or datetime of the first day to include.
+            end (str): ISO date or datetime of the last day to include.
+            tank_id (int): The ID of the tank.
+
+        Returns:
+            pd.DataFrame: Columns `day` (datetime), `n_tests`, and `<param>_avg`,
+                          `<param>_min`, `<param>_max` for each parameter,
+                          ordered by day.
+
+        Raises:
+            ValueError: If the dates are not ISO strings or `tank_id` is invalid.
+            RuntimeError: If a database error occurs.
+        """
+        if not isinstance(tank_id, int) or tank_id < 1:
+            raise ValueError("Invalid tank ID")
+        try:
+            first_day = datetime.fromisoformat(start).date().isoformat()
+            last_day = datetime.fromisoformat(end).date().isoformat()
+        except (ValueError, TypeError):
+            raise ValueError("Start and end dates must be ISO format strings")
+
         try:
-            with get_connection() as conn:
-                return pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
+            with get_reader_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT * FROM water_tests_daily WHERE tank_id = ? AND day BETWEEN ? AND ? ORDER BY day;",
+                    (tank_id, first_day, last_day)
+                )
+                columns = [d[0] for d in cursor.description]
+                rows = cursor.fetchall()
         except sqlite3.Error as e:
             raise RuntimeError(f"Database error: {e}") from e
-        except Exception as e:
-            raise RuntimeError(f"Failed to fetch data: {e}") from e
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        df["day"] = pd.to_datetime(df["day"], format="%Y-%m-%d")
+        return df
 
     def get_latest_for_tank(self, tank_id: int) -> Optional[WaterTestRecord]:
         """
@@ -177,21 +594,79 @@ class WaterTestRepository(BaseRepository):
         """
         if not isinstance(tank_id, int) or tank_id < 1:
             raise ValueError("Invalid tank ID")
-        result = self.fetch_one("SELECT * FROM water_tests WHERE tank_id = ? ORDER BY date DESC LIMIT 1;", (tank_id,))
+        result = self._get_latest_cached(tank_id, _db_stamp())
         return WaterTestRecord(result) if result else None
 
     def get_latest(self) -> Optional[WaterTestRecord]:
         """
         Retrieves the single most recent water test record across all tanks.
         """
-        result = self.fetch_one("SELECT * FROM water_tests ORDER BY date DESC LIMIT 1;")
+        result = self._get_latest_cached(None, _db_stamp())
         return WaterTestRecord(result) if result else None
 
-    def get_custom_ranges(self, tank_id: int) -> Dict[str, Tuple[float, float]]:
+    def get_custom_ranges(self, tank_id: int) -> Mapping[str, Tuple[float, float]]:
         """
         Retrieves all custom safe ranges defined for a specific tank.
+
+        The result is a read-only view shared between calls until the ranges
+        change, so repeated lookups while rendering do not rebuild it.
         """
         if not isinstance(tank_id, int) or tank_id < 1:
             raise ValueError("Invalid tank ID")
-        ranges = self.fetch_all("SELECT parameter, safe_low, safe_high FROM custom_ranges WHERE tank_id = ?;", (tank_id,))
-        return {r['parameter']: (r['safe_low'], r['safe_high']) for r in ranges}
\ No newline at end of file
+        return self._get_custom_ranges_cached(tank_id, _db_stamp())
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_latest_cached(tank_id: Optional[int], db_stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Cached lookup behind `get_latest_for_tank` (and `get_latest` when `tank_id`
+        is `None`). Callers must copy the returned dict before handing it out.
+        """
+        # The inner query is answered from a covering index read backwards:
+        # idx_water_tests_tank_date (tank_id, date) per tank, idx_water_tests_date
+        # across all tanks. SQLite walks an ascending index in reverse for
+        # ORDER BY date DESC, so no separate descending index is needed.
+        if tank_id is None:
+            sql, params = (
+                "SELECT * FROM water_tests WHERE rowid = "
+                "(SELECT rowid FROM water_tests ORDER BY date DESC LIMIT 1);"
+            ), ()
+        else:
+            sql, params = (
+                "SELECT * FROM water_tests WHERE rowid = "
+                "(SELECT rowid FROM water_tests WHERE tank_id = ? ORDER BY date DESC LIMIT 1);"
+            ), (tank_id,)
+        try:
+            with get_reader_connection() as conn:
+                row = conn.execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error: {e}") from e
+        return dict(row) if row else None
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_custom_ranges_cached(tank_id: int, db_stamp: Tuple[int, int]) -> Mapping[str, Tuple[float, float]]:
+        """
+        Cached lookup behind `get_custom_ranges`. The mapping is wrapped in a
+        `MappingProxyType` so the cached object can be handed out directly.
+        """
+        try:
+            with get_reader_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None  # Plain tuples, unpacked positionally below
+                ranges = cursor.execute(
+                    "SELECT parameter, safe_low, safe_high FROM custom_ranges WHERE tank_id = ?;",
+                    (tank_id,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Database error: {e}") from e
+        return MappingProxyType({parameter: (low, high) for parameter, low, high in ranges})
+
+    @classmethod
+    def _invalidate_read_cache(cls) -> None:
+        """
+        Clears the cached hot reads. Called after any write made through the
+        repositories that could change their results.
+        """
+        cls._get_latest_cached.cache_clear()
+        cls._get_custom_ranges_cached.cache_clear()
@@ -11,8 +11,54 @@ initializing and migrating the database schema.
 
 from __future__ import annotations
 import sqlite3
+import zlib
+from typing import Dict, List, Set, Tuple
 from .base import BaseRepository
 
+# Parameters rolled up per tank and day into `water_tests_daily`, each as
+# `<param>_avg`, `<param>_min` and `<param>_max` columns.
+DAILY_PARAMETERS = ("ph", "ammonia", "nitrite", "nitrate", "temperature", "kh", "gh")
+_DAILY_COLUMNS = ", ".join(f"{p}_avg, {p}_min, {p}_max" for p in DAILY_PARAMETERS)
+_DAILY_AGGREGATES = ", ".join(f"AVG({p}), MIN({p}), MAX({p})" for p in DAILY_PARAMETERS)
+
+# STRICT tables need SQLite 3.37 or newer; older builds reject the keyword.
+STRICT_SUPPORTED = sqlite3.sqlite_version_info >= (3, 37, 0)
+
+
+def table_options(*options: str) -> str:
+    """
+    Returns the table options to place after a `CREATE TABLE` column list,
+    leaving out `STRICT` on SQLite builds that do not support it. Such tables
+    then keep SQLite's usual type affinity; their CHECK constraints still apply.
+
+    Args:
+        *options (str): Options such as `"WITHOUT ROWID"` and `"STRICT"`.
+
+    Returns:
+        str: The options joined with commas, possibly empty.
+    """
+    return ", ".join(o for o in options if o != "STRICT" or STRICT_SUPPORTED)
+
+
+def _daily_refresh_sql(row: str) -> str:
+    """
+    Returns the trigger body that recomputes the `water_tests_daily` row for
+    the tank and UTC day of `row` (`NEW` or `OLD`) from the tests left in that
+    day. Recomputing, rather than adjusting running totals, keeps the minimum
+    and maximum correct when a test is deleted.
+    """
+    day_start = f"({row}.date_epoch - {row}.date_epoch % 86400)"
+    return f"""
+            DELETE FROM water_tests_daily
+            WHERE tank_id = {row}.tank_id AND day = date({row}.date_epoch, 'unixepoch');
+            INSERT INTO water_tests_daily (tank_id, day, n_tests, {_DAILY_COLUMNS})
+            SELECT tank_id, date({row}.date_epoch, 'unixepoch'), COUNT(*), {_DAILY_AGGREGATES}
+            FROM water_tests
+            WHERE tank_id = {row}.tank_id
+              AND date_epoch BETWEEN {day_start} AND {day_start} + 86399
+            GROUP BY tank_id;"""
+
+
 class SchemaManager(BaseRepository):
     """
     Manages the AquaLog database schema, including table creation,
@@ -32,28 +78,29 @@ class SchemaManager(BaseRepository):
                 has_co2     BOOLEAN DEFAULT 1,
                 co2_on_hour INTEGER CHECK(co2_on_hour >= 0 AND co2_on_hour <= 23),
                 co2_off_hour INTEGER CHECK(co2_off_hour >= 0 AND co2_off_hour <= 23),
-                created_at  TEXT DEFAULT (datetime('now')),
-                updated_at  TEXT DEFAULT (datetime('now'))
+                created_at  TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at  TEXT DEFAULT CURRENT_TIMESTAMP
             );
         """,
         "water_tests": """
             CREATE TABLE IF NOT EXISTS water_tests (
                 id            INTEGER PRIMARY KEY,
+                tank_id       INTEGER NOT NULL,
                 date          TEXT    NOT NULL CHECK(date != ''),
+                date_epoch    INTEGER,
                 ph            REAL    CHECK(ph >= 0 AND ph <= 14),
+                temperature   REAL    CHECK(temperature >= 0 AND temperature <= 40),
                 ammonia       REAL    CHECK(ammonia >= 0 AND ammonia <= 100),
                 nitrite       REAL    CHECK(nitrite >= 0 AND nitrite <= 100),
                 nitrate       REAL    CHECK(nitrate >= 0 AND nitrate <= 100),
-                temperature   REAL    CHECK(temperature >= 0 AND temperature <= 40),
-                kh            REAL    DEFAULT 0 CHECK(kh >= 0 AND kh <= 30),
                 co2_indicator TEXT    CHECK(co2_indicator IN ('Green', 'Blue', 'Yellow')),
+                kh            REAL    DEFAULT 0 CHECK(kh >= 0 AND kh <= 30),
                 gh            REAL    DEFAULT 0 CHECK(gh >= 0 AND gh <= 30),
-                tank_id       INTEGER NOT NULL,
                 notes         TEXT,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
             );
         """,
-        "plants": """
+        "plants": f"""
             CREATE TABLE IF NOT EXISTS plants (
                 plant_id      INTEGER PRIMARY KEY,
                 plant_name    TEXT    NOT NULL CHECK(length(trim(plant_name)) > 0),
@@ -68,9 +115,9 @@ class SchemaManager(BaseRepository):
                 co2_demand    TEXT,
                 co2_info      TEXT,
                 thumbnail_url TEXT,
-                created_at    TEXT    DEFAULT (datetime('now')),
-                updated_at    TEXT    DEFAULT (datetime('now'))
-            );
+                created_at    TEXT    DEFAULT CURRENT_TIMESTAMP,
+                updated_at    TEXT    DEFAULT CURRENT_TIMESTAMP
+            ) {table_options("STRICT")};
         """,
         "owned_plants": """
             CREATE TABLE IF NOT EXISTS owned_plants (
@@ -78,7 +125,7 @@ class SchemaManager(BaseRepository):
                 tank_id      INTEGER NOT NULL,
                 common_name  TEXT,
                 quantity     INTEGER DEFAULT 1,
-                created_at   TEXT    DEFAULT (datetime('now')),
+                created_at   TEXT    DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (plant_id, tank_id),
                 FOREIGN KEY (plant_id) REFERENCES plants(plant_id) ON DELETE CASCADE,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
@@ -105,7 +152,7 @@ class SchemaManager(BaseRepository):
                 fish_id      INTEGER NOT NULL,
                 tank_id      INTEGER NOT NULL,
                 quantity     INTEGER DEFAULT 1,
-                created_at   TEXT    DEFAULT (datetime('now')),
+                created_at   TEXT    DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (fish_id) REFERENCES fish(fish_id) ON DELETE CASCADE,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE,
                 UNIQUE (fish_id, tank_id)
@@ -117,8 +164,8 @@ class SchemaManager(BaseRepository):
                 start_date      TEXT    NOT NULL,
                 completed_date  TEXT,
                 notes           TEXT,
-                created_at      TEXT    DEFAULT (datetime('now')),
-                updated_at      TEXT    DEFAULT (datetime('now'))
+                created_at      TEXT    DEFAULT CURRENT_TIMESTAMP,
+                updated_at      TEXT    DEFAULT CURRENT_TIMESTAMP
             );
         """,
         "maintenance_cycles": """
@@ -130,8 +177,8 @@ class SchemaManager(BaseRepository):
                 description      TEXT,
                 notes           TEXT,
                 is_active        BOOLEAN DEFAULT 1,
-                created_at       TEXT    DEFAULT (datetime('now')),
-                updated_at       TEXT    DEFAULT (datetime('now')),
+                created_at       TEXT    DEFAULT CURRENT_TIMESTAMP,
+                updated_at       TEXT    DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
             );
         """,
@@ -148,7 +195,7 @@ class SchemaManager(BaseRepository):
                 notes            TEXT,
                 next_due         TEXT,
                 is_completed     BOOLEAN DEFAULT 1,
-                created_at       TEXT    DEFAULT (datetime('now')),
+                created_at       TEXT    DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE,
                 FOREIGN KEY (cycle_id) REFERENCES maintenance_cycles(id) ON DELETE SET NULL
             );
@@ -164,22 +211,21 @@ class SchemaManager(BaseRepository):
                 include_cost   BOOLEAN DEFAULT 0,
                 include_stats  BOOLEAN DEFAULT 1,
                 include_cycle  BOOLEAN DEFAULT 0,
-                created_at     TEXT    DEFAULT (datetime('now')),
-                updated_at     TEXT    DEFAULT (datetime('now'))
+                created_at     TEXT    DEFAULT CURRENT_TIMESTAMP,
+                updated_at     TEXT    DEFAULT CURRENT_TIMESTAMP
             );
         """,
-        "custom_ranges": """
+        "custom_ranges": f"""
             CREATE TABLE IF NOT EXISTS custom_ranges (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
                 tank_id     INTEGER NOT NULL,
                 parameter   TEXT    NOT NULL CHECK(parameter IN ('ph','ammonia','nitrite','nitrate','kh','gh','temperature')),
                 safe_low    REAL    NOT NULL,
                 safe_high   REAL    NOT NULL CHECK(safe_high > safe_low),
-                created_at  TEXT    DEFAULT (datetime('now')),
-                updated_at  TEXT    DEFAULT (datetime('now')),
-                UNIQUE(tank_id, parameter),
+                created_at  TEXT    DEFAULT CURRENT_TIMESTAMP,
+                updated_at  TEXT    DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tank_id, parameter),
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
-            );
+            ) {table_options("WITHOUT ROWID", "STRICT")};
         """,
         "equipment": """
             CREATE TABLE IF NOT EXISTS equipment (
@@ -191,81 +237,302 @@ class SchemaManager(BaseRepository):
                 tank_id       INTEGER NOT NULL,
                 FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
             );
+        """,
+        # Per-tank daily rollup of `water_tests`, kept current by the
+        # `water_tests_daily_*` triggers, so charts over long periods read one
+        # row per day instead of every test.
+        "water_tests_daily": f"""
+            CREATE TABLE IF NOT EXISTS water_tests_daily (
+                tank_id     INTEGER NOT NULL,
+                day         TEXT    NOT NULL,
+                n_tests     INTEGER NOT NULL,
+                {", ".join(f"{p}_avg REAL, {p}_min REAL, {p}_max REAL" for p in DAILY_PARAMETERS)},
+                PRIMARY KEY (tank_id, day),
+                FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
+            ) {table_options("WITHOUT ROWID", "STRICT")};
         """
     }
 
     INDEXES = [
         "CREATE INDEX IF NOT EXISTS idx_water_tests_date ON water_tests(date);",
-        "CREATE INDEX IF NOT EXISTS idx_water_tests_tank_id ON water_tests(tank_id);",
-        "CREATE INDEX IF NOT EXISTS idx_maintenance_log_tank_id ON maintenance_log(tank_id);",
+        # Per-tank date range reads seek to the tank and walk its tests already
+        # sorted by date. The composite also covers plain tank_id lookups
+        # (including the ON DELETE CASCADE from tanks), so the old single-column
+        # index is dropped from existing databases. Latest-test lookups read
+        # both date indexes backwards, so no DESC copies are kept.
+        "CREATE INDEX IF NOT EXISTS idx_water_tests_tank_date ON water_tests(tank_id, date);",
+        "DROP INDEX IF EXISTS idx_water_tests_tank_id;",
+        # Date range reads filter on the integer copy of `date`.
+        "CREATE INDEX IF NOT EXISTS idx_water_tests_tank_epoch ON water_tests(tank_id, date_epoch);",
+        # The maintenance log and equipment lists are read per tank in a fixed
+        # order; these composites return them pre-sorted (the log by walking
+        # the index backwards) and still cover the tank_id foreign keys, so
+        # they replace the single-column indexes.
+        "CREATE INDEX IF NOT EXISTS idx_maintenance_log_tank_date ON maintenance_log(tank_id, date);",
+        "DROP INDEX IF EXISTS idx_maintenance_log_tank_id;",
         "CREATE INDEX IF NOT EXISTS idx_maintenance_cycles_tank_id ON maintenance_cycles(tank_id);",
+        # New log entries can only be linked to active cycles; this smaller
+        # index holds just those rows for the `active_only` lookup.
+        "CREATE INDEX IF NOT EXISTS idx_maintenance_cycles_active ON maintenance_cycles(tank_id) WHERE is_active = 1;",
         "CREATE INDEX IF NOT EXISTS idx_maintenance_log_cycle_id ON maintenance_log(cycle_id);",
-        "CREATE INDEX IF NOT EXISTS idx_custom_ranges_tank_id ON custom_ranges(tank_id);",
+        # owned_plants and owned_fish need no plant_id/fish_id index: their
+        # primary key and UNIQUE constraint both lead with that column.
         "CREATE INDEX IF NOT EXISTS idx_owned_plants_tank_id ON owned_plants(tank_id);",
         "CREATE INDEX IF NOT EXISTS idx_owned_fish_tank_id ON owned_fish(tank_id);",
-        "CREATE INDEX IF NOT EXISTS idx_equipment_tank_id ON equipment(tank_id);"
+        "CREATE INDEX IF NOT EXISTS idx_equipment_tank_category ON equipment(tank_id, category, name COLLATE NOCASE);",
+        "DROP INDEX IF EXISTS idx_equipment_tank_id;",
     ]
 
+    # `updated_at` is set by the repositories' UPDATE statements and a cycle's
+    # `next_due` is computed in MaintenanceRepository's INSERT, so the triggers
+    # older databases were created with for those are dropped, as each fired a
+    # second write for every row they touched. The only triggers left maintain
+    # the `water_tests_daily` rollup (water tests are never updated in place).
     TRIGGERS = [
-        """
-        CREATE TRIGGER IF NOT EXISTS update_tank_timestamp
-        AFTER UPDATE ON tanks
-        FOR EACH ROW
-        BEGIN
-            UPDATE tanks SET updated_at = datetime('now') WHERE id = OLD.id;
+        "DROP TRIGGER IF EXISTS update_tank_timestamp;",
+        "DROP TRIGGER IF EXISTS update_plants_timestamp;",
+        "DROP TRIGGER IF EXISTS update_maintenance_cycles_timestamp;",
+        "DROP TRIGGER IF EXISTS set_next_maintenance_due;",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS water_tests_daily_insert
+        AFTER INSERT ON water_tests
+        FOR EACH ROW WHEN NEW.date_epoch IS NOT NULL
+        BEGIN{_daily_refresh_sql("NEW")}
         END;
         """,
-        
-        """
-        CREATE TRIGGER IF NOT EXISTS update_plants_timestamp
-        AFTER UPDATE ON plants
-        FOR EACH ROW
-        BEGIN
-            UPDATE plants SET updated_at = datetime('now') WHERE plant_id = OLD.plant_id;
+        f"""
+        CREATE TRIGGER IF NOT EXISTS water_tests_daily_delete
+        AFTER DELETE ON water_tests
+        FOR EACH ROW WHEN OLD.date_epoch IS NOT NULL
+        BEGIN{_daily_refresh_sql("OLD")}
         END;
         """,
-        """
-        CREATE TRIGGER IF NOT EXISTS update_maintenance_cycles_timestamp
-        AFTER UPDATE ON maintenance_cycles
-        FOR EACH ROW
-        BEGIN
-            UPDATE maintenance_cycles SET updated_at = datetime('now') WHERE id = OLD.id;
-        END;
-        """,
-        """
-        CREATE TRIGGER IF NOT EXISTS set_next_maintenance_due
-        AFTER INSERT ON maintenance_log
-        FOR EACH ROW WHEN NEW.cycle_id IS NOT NULL AND NEW.is_completed = 1
-        BEGIN
-            UPDATE maintenance_log 
-            SET next_due = date(
-                NEW.date, 
-                '+' || (SELECT frequency_days FROM maintenance_cycles WHERE id = NEW.cycle_id) || ' days'
-            )
-            WHERE id = NEW.id;
-        END;
-        """
     ]
 
+    # Columns added after a table's first release, as (table, column, declaration).
+    # Databases created before a column existed get it through `_ensure_column`.
+    ADDED_COLUMNS = [
+        ("water_tests", "date_epoch", "INTEGER"),
+    ]
+
+    # Tables whose definition changed in a way ALTER TABLE cannot express, as
+    # {table: text the stored CREATE statement must contain, compared with runs
+    # of whitespace collapsed to one space}. Databases whose table lacks the
+    # marker are rebuilt from `TABLE_SCHEMAS` by `_rebuild_table`.
+    REBUILT_TABLES = {
+        "custom_ranges": "WITHOUT ROWID",
+        # Without STRICT support there is nothing to rebuild plants for.
+        **({"plants": "STRICT"} if STRICT_SUPPORTED else {}),
+        # Columns filtered on in every query lead the record, and the often
+        # NULL free-text notes come last.
+        "water_tests": "id INTEGER PRIMARY KEY, tank_id INTEGER NOT NULL,",
+    }
+
+    # The fixed parts of the `init_tables` script, joined once here; only the
+    # migrations between them depend on the database being initialized.
+    _INIT_SCRIPT_HEAD = "\n".join(["BEGIN IMMEDIATE;", *TABLE_SCHEMAS.values()])
+    _INIT_SCRIPT_BODY = "\n".join([
+        # `date_epoch` mirrors `date` as Unix seconds, reading naive ISO text
+        # as UTC exactly like WaterTestRepository does. Filling any gaps here
+        # also covers rows written by older versions of the app.
+        "UPDATE water_tests SET date_epoch = CAST(strftime('%s', date) AS INTEGER) "
+        "WHERE date_epoch IS NULL;",
+        # The daily rollup is seeded from existing tests the first time it is
+        # empty; the triggers keep it current from then on.
+        f"INSERT INTO water_tests_daily (tank_id, day, n_tests, {_DAILY_COLUMNS}) "
+        f"SELECT tank_id, date(date_epoch, 'unixepoch') AS day, COUNT(*), {_DAILY_AGGREGATES} "
+        "FROM water_tests "
+        "WHERE date_epoch IS NOT NULL AND NOT EXISTS (SELECT 1 FROM water_tests_daily) "
+        "GROUP BY tank_id, day;",
+        *INDEXES,
+        *TRIGGERS,
+        # The default tank is only created in a database without tanks; the
+        # NOT EXISTS probe is a read, so nothing is written otherwise.
+        "INSERT INTO tanks (id, name) SELECT 1, 'Default Tank' "
+        "WHERE NOT EXISTS (SELECT 1 FROM tanks);",
+        # Give the planner statistics for the indexes above straight away
+        # rather than leaving it on heuristics until someone runs ANALYZE.
+        # analysis_limit samples each index, keeping this quick on large tables.
+        "PRAGMA analysis_limit = 400;",
+        "ANALYZE;",
+    ])
+
+    # Checksum of the script text above plus the migration definitions, stored
+    # in `PRAGMA user_version` once `init_tables` has brought a database up to
+    # date. Any edit to the tables, indexes, triggers, data fix-ups or
+    # migrations changes it. user_version is a signed 32-bit integer, hence
+    # the 31-bit mask.
+    SCHEMA_FINGERPRINT = zlib.crc32(
+        repr((_INIT_SCRIPT_HEAD, _INIT_SCRIPT_BODY, ADDED_COLUMNS, REBUILT_TABLES)).encode()
+    ) & 0x7FFFFFFF
+
+    # Stamped last, so only a fully committed initialization records it.
+    _INIT_SCRIPT_TAIL = "\n".join([
+        _INIT_SCRIPT_BODY,
+        f"PRAGMA user_version = {SCHEMA_FINGERPRINT};",
+        "COMMIT;",
+    ])
+
     def init_tables(self) -> None:
         """
         Initializes all database tables, creates necessary indexes, and sets up
         triggers as defined in the `TABLE_SCHEMAS`, `INDEXES`, and `TRIGGERS` attributes.
         Also inserts a 'Default Tank' if no tanks exist.
+
+        All DDL, migrations and data fix-ups run in a single transaction on a
+        connection that is already in WAL mode with the pool's tuning PRAGMAs.
+
+        A database whose `user_version` already equals `SCHEMA_FINGERPRINT` was
+        initialized with this exact schema, so it is left untouched. A brand-new,
+        empty database is built in memory and copied over by `_bootstrap`.
         """
         with self._connection() as conn:
             cursor = conn.cursor()
 
-            for schema_sql in self.TABLE_SCHEMAS.values():
-                cursor.execute(schema_sql)
+            if cursor.execute("PRAGMA user_version;").fetchone()[0] == self.SCHEMA_FINGERPRINT:
+                return
+
+            if not cursor.execute("SELECT 1 FROM sqlite_master LIMIT 1;").fetchone():
+                self._bootstrap(conn)
+                return
+
+            # Migrations only apply to tables that already exist; anything
+            # missing is created below with its current definition. One
+            # snapshot of every table's definition and columns, taken before
+            # any DDL runs, serves all of them.
+            table_sql, columns = self._schema_snapshot(cursor)
+            migrations: List[str] = []
+            for table, marker in self.REBUILT_TABLES.items():
+                migrations += self._rebuild_table(table, marker, table_sql, columns)
+            for table, column, decl in self.ADDED_COLUMNS:
+                migrations += self._ensure_column(columns, table, column, decl)
+
+            # Everything runs as one script inside a single write transaction,
+            # so the whole initialization commits (and syncs) once, and a
+            # failure part-way rolls all of it back. executescript() commits
+            # before it starts, which is why the migrations are prepared as SQL
+            # above rather than executed between separate scripts.
+            # Dropping the old copy of a rebuilt table with foreign keys enabled
+            # would first delete its rows, cascading to child tables (plants to
+            # owned_plants). As in SQLite's documented rebuild procedure, they
+            # are switched off around the script; the rebuilt tables keep their
+            # names, so child references stay valid. The PRAGMA has no effect
+            # inside a transaction, hence the rollback before re-enabling.
+            conn.execute("PRAGMA foreign_keys = OFF;")
+            try:
+                conn.executescript("\n".join([self._INIT_SCRIPT_HEAD, *migrations, self._INIT_SCRIPT_TAIL]))
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.execute("PRAGMA foreign_keys = ON;")
+
+    def _bootstrap(self, conn: sqlite3.Connection) -> None:
+        """
+        Creates the full schema for an empty database by running the init script
+        on an in-memory database and copying its pages into `conn`'s file with
+        SQLite's backup API. The file is then written in one sequential pass
+        instead of page by page as each table and index is created. The copy
+        keeps the file's WAL mode and carries over the `user_version` stamp.
+
+        Args:
+            conn (sqlite3.Connection): The connection to the empty target database.
+        """
+        scratch = sqlite3.connect(":memory:")
+        try:
+            scratch.executescript("\n".join([self._INIT_SCRIPT_HEAD, self._INIT_SCRIPT_TAIL]))
+            scratch.backup(conn)
+        finally:
+            scratch.close()
+
+    @staticmethod
+    def _schema_snapshot(cursor: sqlite3.Cursor) -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+        """
+        Reads the `CREATE TABLE` statement and column names of every table in a
+        single query, for the migration helpers to consult instead of issuing a
+        `PRAGMA table_info` per check.
+
+        Returns:
+            Tuple[Dict[str, str], Dict[str, Set[str]]]: The stored SQL and the set
+            of column names, each keyed by table name.
+        """
+        table_sql: Dict[str, str] = {}
+        columns: Dict[str, Set[str]] = {}
+        cursor.execute(
+            "SELECT m.name, m.sql, p.name FROM sqlite_master AS m "
+            "JOIN pragma_table_info(m.name) AS p WHERE m.type = 'table';"
+        )
+        for table, sql, column in cursor.fetchall():
+            table_sql[table] = sql
+            columns.setdefault(table, set()).add(column)
+        return table_sql, columns
 
-            for idx_sql in self.INDEXES:
-                cursor.execute(idx_sql)
+    @staticmethod
+    def _ensure_column(columns: Dict[str, Set[str]], table: str, column: str, decl: str) -> List[str]:
+        """
+        Returns the statement that adds `column` to `table` if an existing
+        database predates it.
 
-            for trg_sql in self.TRIGGERS:
-                cursor.execute(trg_sql)
+        Args:
+            columns (Dict[str, Set[str]]): The column snapshot from `_schema_snapshot`,
+                                           updated in place when a column is added.
+            table (str): The table to check.
+            column (str): The column name.
+            decl (str): The column type and constraints for `ALTER TABLE ... ADD COLUMN`.
+
+        Returns:
+            List[str]: The `ALTER TABLE` statement, or an empty list if the column
+                       already exists or the table has yet to be created.
+        """
+        if table not in columns or column in columns[table]:
+            return []
+        columns[table].add(column)
+        return [f"ALTER TABLE {table} ADD COLUMN {column} {decl};"]
+
+    def _rebuild_table(
+        self,
+        table: str,
+        marker: str,
+        table_sql: Dict[str, str],
+        columns: Dict[str, Set[str]],
+    ) -> List[str]:
+        """
+        Returns the statements that recreate `table` from its `TABLE_SCHEMAS`
+        definition if the stored definition does not contain `marker`, copying
+        across every column the old and new layouts share. Indexes and triggers
+        on the table are dropped with it and recreated by the rest of `init_tables`.
+
+        Args:
+            table (str): The table to check.
+            marker (str): Text the up-to-date `CREATE TABLE` statement contains,
+                          with single spaces between words.
+            table_sql (Dict[str, str]): Stored table definitions from `_schema_snapshot`.
+            columns (Dict[str, Set[str]]): The column snapshot from `_schema_snapshot`,
+                                           updated in place when the table is rebuilt.
+
+        Returns:
+            List[str]: The rebuild statements, or an empty list if the table is
+                       already current or has yet to be created.
+        """
+        if table not in table_sql or marker in " ".join(table_sql[table].split()):
+            return []
 
-            cursor.execute(
-                "INSERT OR IGNORE INTO tanks (id, name) VALUES (1, 'Default Tank');"
-            )
-            conn.commit()
\ No newline at end of file
+        create_sql = self.TABLE_SCHEMAS[table].replace(
+            f"CREATE TABLE IF NOT EXISTS {table} (", f"CREATE TABLE {table}__new (", 1
+        )
+        # The new layout's columns come from the definition itself, compiled on
+        # a throwaway in-memory database.
+        scratch = sqlite3.connect(":memory:")
+        try:
+            scratch.execute(create_sql)
+            new_columns = [r[1] for r in scratch.execute(f"PRAGMA table_info({table}__new);")]
+        finally:
+            scratch.close()
+        shared = ", ".join(c for c in new_columns if c in columns[table])
+        table_sql[table] = create_sql
+        columns[table] = set(new_columns)
+        return [
+            create_sql,
+            f"INSERT INTO {table}__new ({shared}) SELECT {shared} FROM {table};",
+            f"DROP TABLE {table};",
+            f"ALTER TABLE {table}__new RENAME TO {table};",
+        ]
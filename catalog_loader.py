@@ -0,0 +1,166 @@
+# catalog_loader.py
+
+"""
+catalog_loader.py – Shared loader for the master catalogue tables.
+
+Used by injectFish.py and injectPlants.py, which only supply a table schema
+and a CSV-to-column mapping.
+- Connects to the aqualog.db database.
+- Empties the existing table, or drops and re-creates it with the given
+  schema if its columns differ.
+- Reads records from the CSV file and inserts them into the table.
+"""
+import csv
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+# --- Configuration ---
+# This module assumes it's in the same directory as the database and CSV files.
+PROJECT_ROOT = Path(__file__).resolve().parent
+DB_PATH = PROJECT_ROOT / "aqualog.db"
+
+# One (CSV header, table column, cast) entry per inserted column. The cast is
+# the Python type a numeric field is converted to before binding; text
+# columns (None) are passed through as read.
+Column = Tuple[str, str, Optional[Callable[[str], Any]]]
+
+# Bound parameters allowed in one statement by SQLite builds older than 3.32
+# (SQLITE_MAX_VARIABLE_NUMBER); each multi-row INSERT stays within it.
+MAX_SQL_PARAMS = 999
+
+def _table_matches(cur: sqlite3.Cursor, table_name: str, schema_sql: str) -> bool:
+    """
+    Checks whether the existing table has exactly the columns `schema_sql`
+    would create, by comparing `PRAGMA table_info` with that of a scratch
+    in-memory copy.
+    """
+    with sqlite3.connect(":memory:") as scratch:
+        scratch.execute(schema_sql)
+        expected = scratch.execute(f"PRAGMA table_info({table_name});").fetchall()
+    return cur.execute(f"PRAGMA table_info({table_name});").fetchall() == expected
+
+def _cast(cast, value):
+    """Converts one CSV field for binding; blank numeric fields become NULL."""
+    if cast is None or value is None:
+        return value
+    value = value.strip()
+    return cast(value) if value else None
+
+def _read_rows(reader: Iterator[list], header: list, columns: Sequence[Column]) -> Iterator[Tuple]:
+    """
+    Yields one insert tuple per non-empty CSV row. Column positions are
+    resolved once from the header, so each row is picked apart by index
+    rather than turned into a dict; missing columns and short rows give None.
+    Numeric fields are converted here, so they are stored as REAL/INTEGER
+    (blank ones as NULL) instead of leaving empty strings as TEXT.
+    """
+    width = len(header)
+    # Missing headers point at the padding slot one past the last column.
+    fields = [(header.index(c) if c in header else width, cast) for c, _, cast in columns]
+    for row in reader:
+        if not row:
+            continue
+        row += [None] * (width + 1 - len(row))
+        yield tuple(_cast(cast, row[i]) for i, cast in fields)
+
+def load(table_name: str, schema_sql: str, csv_path: Path, columns: Sequence[Column]) -> None:
+    """
+    Ensures a catalogue table exists with the given schema and reloads its
+    contents from a CSV file.
+
+    Args:
+        table_name (str): The table to load, as created by `schema_sql`.
+        schema_sql (str): The `CREATE TABLE` statement for the table.
+        csv_path (Path): The CSV file to read; its first row is the header.
+        columns (Sequence[Column]): (CSV header, table column, cast) for each
+                                    inserted column.
+    """
+    # Open the CSV up front: a missing file is reported before the database
+    # is touched, without a separate exists() check.
+    try:
+        fh = csv_path.open(newline="", encoding="utf-8-sig") # Use utf-8-sig to handle potential BOM
+    except FileNotFoundError:
+        print(f"❌ ERROR: Could not find {csv_path.name} at {csv_path}")
+        return
+
+    with fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        if not header:
+            print(f"❌ ERROR: {csv_path.name} is empty or has no header.")
+            return
+
+        # Rows are inserted in batches, one multi-row INSERT per batch, so
+        # SQLite steps one statement per batch instead of one per row.
+        column_list = ", ".join(col for _, col, _ in columns)
+        row_sql = f"({', '.join('?' for _ in columns)})"
+        batch_size = max(1, MAX_SQL_PARAMS // len(columns))
+
+        def insert_sql(rows: int) -> str:
+            return f"INSERT INTO {table_name} ({column_list}) VALUES {', '.join([row_sql] * rows)};"
+
+        print(f"🗄️  Connecting to database: {DB_PATH}")
+        # Autocommit mode, so the explicit BEGIN/COMMIT below are the only
+        # transaction boundaries.
+        conn = sqlite3.connect(DB_PATH, isolation_level=None)
+        try:
+            cur = conn.cursor()
+            # Same journal mode as the app's connections (see
+            # aqualog_db/connection.py), so a running app keeps reading while
+            # the catalogue loads; WAL is unavailable on some filesystems.
+            try:
+                cur.execute("PRAGMA journal_mode = WAL;")
+            except sqlite3.Error:
+                pass
+            # Wait for the app's writers rather than failing BEGIN IMMEDIATE
+            # with "database is locked".
+            cur.execute("PRAGMA busy_timeout = 30000;")
+            # Bulk-load settings. They only last for this connection, so the app's
+            # own connections keep their usual durability settings.
+            cur.execute("PRAGMA synchronous = OFF;")
+            cur.execute("PRAGMA temp_store = MEMORY;")
+            cur.execute("PRAGMA cache_size = -65536;")  # ~64 MB
+            # Clear (or rebuild) and load the catalogue in one write transaction, so
+            # the import pays for a single commit and readers never see a
+            # missing or half-filled table.
+            cur.execute("BEGIN IMMEDIATE;")
+
+            if _table_matches(cur, table_name, schema_sql):
+                # Same schema: empty the table in place (SQLite's truncate
+                # optimisation) instead of dropping and re-creating it.
+                print(f"-> Clearing the existing '{table_name}' table for a clean import...")
+                cur.execute(f"DELETE FROM {table_name};")
+            else:
+                print(f"-> Dropping old '{table_name}' table (if it exists) for a clean import...")
+                cur.execute(f"DROP TABLE IF EXISTS {table_name};")
+
+                print(f"-> Creating new '{table_name}' table with the application schema...")
+                cur.execute(schema_sql)
+
+            print(f"-> Loading data from {csv_path.name}...")
+            try:
+                # Rows are streamed from the CSV reader one batch at a time
+                # rather than collected in a list first.
+                rows = _read_rows(reader, header, columns)
+                full_batch_sql = insert_sql(batch_size)
+                inserted = 0
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    sql = full_batch_sql if len(batch) == batch_size else insert_sql(len(batch))
+                    cur.execute(sql, [value for row in batch for value in row])
+                    inserted += len(batch)
+                print(f"✅ Inserted {inserted} records into '{table_name}'.")
+
+                cur.execute("COMMIT;")
+                print(f"🎉 {table_name.capitalize()} data injection complete.")
+            except Exception as e:
+                print(f"❌ An error occurred during {table_name} data injection: {e}")
+                conn.rollback()
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.close()
@@ -10,16 +10,21 @@ tables or warning cards to ensure a consistent look and feel across tabs.
 
 from __future__ import annotations # Added for type hinting consistency
 
+from types import MappingProxyType
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 from pandas.io.formats.style import Styler
 from datetime import date, timedelta
-from config import LOW_ACTION_PLANS, ACTION_PLANS
+from typing import Mapping
+from config import LOW_ACTION_PLANS, ACTION_PLANS, SAFE_RANGES
 
 # Dictionary containing tooltip messages for each water parameter input
 # in the sidebar's water test form. These provide users with quick
-# contextual information and ideal ranges for each parameter.
-tooltips: dict[str, str] = {
+# contextual information and ideal ranges for each parameter. Read-only,
+# since it is shared by every session.
+tooltips: Mapping[str, str] = MappingProxyType({
     "temperature": "Water temperature in °C (ideal: 22–26 °C).",
     "pH":          "Acidity/alkalinity (ideal: 6.5–7.6).",
     "ammonia":     "NH₃/NH₄⁺ (should be 0 ppm); toxicity depends on pH & temp.",
@@ -28,8 +33,22 @@ tooltips: dict[str, str] = {
     "kh":          "Carbonate Hardness in dKH (ideal: 3–5 dKH).",
     "gh":          "General Hardness in °dH (ideal: 3–8 °dH).",
     "co2":         "CO₂ indicator color: Green=OK, Blue=low, Yellow=high."
+})
+
+# Units shown after the label of a metric card; parameters not listed here
+# are shown without a unit.
+_METRIC_UNITS: dict[str, str] = {"gh": "°dH", "kh": "dKH"}
+
+# Metric card labels (e.g., "KH dKH", "Ammonia"), built once at import rather
+# than on every card render.
+_METRIC_LABELS: dict[str, str] = {
+    param: f"{param.upper() if param in _METRIC_UNITS else param.capitalize()} {_METRIC_UNITS.get(param, '')}".strip()
+    for param in SAFE_RANGES
 }
 
+# Parameter names as shown on warning cards (e.g., "Co2 Indicator").
+_WARNING_NAMES: dict[str, str] = {param: param.replace("_", " ").title() for param in SAFE_RANGES}
+
 
 def display_parameter_warning(param: str, value: float, safe_range: tuple, is_low: bool) -> None:
     """
@@ -45,7 +64,7 @@ def display_parameter_warning(param: str, value: float, safe_range: tuple, is_lo
         is_low (bool): A boolean indicating if the value is too low (`True`)
                        or too high (`False`).
     """
-    param_name = param.replace("_", " ").title()
+    param_name = _WARNING_NAMES.get(param) or param.replace("_", " ").title()
     low_val, high_val = safe_range
     
     if is_low:
@@ -62,12 +81,13 @@ def display_parameter_warning(param: str, value: float, safe_range: tuple, is_lo
     
     # Retrieve the appropriate action plan based on whether the value is too low or too high.
     action_plan = LOW_ACTION_PLANS.get(param) if is_low else ACTION_PLANS.get(param)
+    # The heading, steps and separator go out as a single Markdown element
+    # rather than one element per step.
     if action_plan:
-        st.markdown("**Recommended Actions:**")
-        for step in action_plan:
-            st.write(f"• {step}")
-
-    st.markdown("---")
+        steps = "\n".join(f"- {step}" for step in action_plan)
+        st.markdown(f"**Recommended Actions:**\n\n{steps}\n\n---")
+    else:
+        st.markdown("---")
 
 
 def display_metric_card(param: str, value: float, count: int, safe_ranges: dict[str, tuple[float, float]]) -> None: # Refined safe_ranges type
@@ -89,63 +109,81 @@ def display_metric_card(param: str, value: float, count: int, safe_ranges: dict[
     # Determine if the value is within the safe range.
     within = lo is not None and hi is not None and lo <= value <= hi
     
-    # Format label for display (e.g., "KH", "pH", "Ammonia").
-    label = param.upper() if param in ("kh", "gh") else param.capitalize()
-    
-    # Add units if available.
-    unit = "°dH" if param == "gh" else "dKH" if param == "kh" else ""
+    # Look up the display label (e.g., "KH dKH", "Ph", "Ammonia").
+    label = _METRIC_LABELS.get(param) or param.capitalize()
     
     st.metric(
-        label=f"{label} {unit}".strip(),
+        label=label,
         value=f"{value:.2f}",
         delta=f"{count} readings",
         delta_color="normal" if within else "inverse" # Green for normal, red for out-of-range
     )
 
 
-def _highlight(v: float, lo: float, hi: float) -> str:
+# CSS applied by `highlight_out_of_range` to out-of-range cells.
+OUT_OF_RANGE_CSS = "background-color: red; color: white;"
+
+
+def _out_of_range_css(values: pd.DataFrame, ranges: list[tuple[float, float]]) -> pd.DataFrame:
     """
-    Helper function to determine the CSS style for a DataFrame cell based on
-    its numerical value being outside a specified safe range.
+    Builds the CSS for every cell of the range-checked columns.
 
     Args:
-        v (float): The numerical value of the cell.
-        lo (float): The lower bound of the safe range.
-        hi (float): The upper bound of the high range.
+        values (pd.DataFrame): The readings of the range-checked columns.
+        ranges (list[tuple[float, float]]): `(low, high)` for each column of `values`.
 
     Returns:
-        str: A CSS string for `background-color: red; color: white;` if the
-             value is out of range, otherwise an empty string.
+        pd.DataFrame: CSS strings aligned with `values`.
     """
-    if lo is None or hi is None or pd.isna(v):
-        return ""
-    return "background-color: red; color: white;" if (v < lo or v > hi) else ""
-
-
-def highlight_out_of_range(df: pd.DataFrame, safe_ranges: dict[str, tuple[float, float]]) -> Styler: # Refined safe_ranges type
+    # One broadcast comparison over the whole (rows x columns) block instead
+    # of a pass per column. Non-numeric cells (e.g. formatted strings) become
+    # NaN and, like missing values and missing bounds, compare as in range.
+    lows = np.array([np.nan if lo is None else lo for lo, _ in ranges], dtype=float)
+    highs = np.array([np.nan if hi is None else hi for _, hi in ranges], dtype=float)
+    vals = values.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    css = np.where((vals < lows) | (vals > highs), OUT_OF_RANGE_CSS, "")
+    return pd.DataFrame(css, index=values.index, columns=values.columns)
+
+
+def highlight_out_of_range(
+    df: pd.DataFrame,
+    safe_ranges: dict[str, tuple[float, float]], # Refined safe_ranges type
+    max_rows: int | None = None,
+    values: pd.DataFrame | None = None,
+) -> Styler:
     """
     Applies conditional styling to a Pandas DataFrame to visually highlight
     cells with numerical values that fall outside their defined safe ranges.
 
+    The CSS for all range-checked cells is computed in one vectorized pass.
+    When `max_rows` is given, only the first `max_rows` rows are styled and
+    returned; callers passing it should tell the user the table was truncated.
+
     Args:
         df (pd.DataFrame): The input Pandas DataFrame to style.
         safe_ranges (dict[str, tuple[float, float]]): A dictionary where keys are parameter names (expected
                                                  as column names in the DataFrame) and values are
                                                  tuples `(low_safe_value, high_safe_value)`.
+        max_rows (int | None): The maximum number of rows to style and return.
+                               Defaults to None, which styles the whole DataFrame.
+        values (pd.DataFrame | None): The raw readings to range-check, with the same
+                                      index and column names as `df`, for tables whose
+                                      displayed cells are formatted text. Defaults to `df`.
 
     Returns:
         Styler: A Pandas Styler object with the applied highlighting, ready for
                 rendering in Streamlit using `st.dataframe`.
     """
-    styler = df.style
-    for param, (lo, hi) in safe_ranges.items():
-        if param in df.columns:
-            # Apply the _highlight function to the specific column
-            styler = styler.map(
-                lambda v, lo=lo, hi=hi: _highlight(v, lo, hi),
-                subset=[param]
-            )
-    return styler
+    if values is None:
+        values = df
+    if max_rows is not None and len(df) > max_rows:
+        df = df.head(max_rows)
+        values = values.head(max_rows)
+    cols = [param for param in safe_ranges if param in df.columns and param in values.columns]
+    if not cols:
+        return df.style
+    css = _out_of_range_css(values[cols], [tuple(safe_ranges[col]) for col in cols])
+    return df.style.apply(lambda _: css, subset=cols, axis=None)
 
 
 def date_range_selector(label: str) -> tuple[str, str]:
@@ -153,6 +191,8 @@ def date_range_selector(label: str) -> tuple[str, str]:
     Renders a Streamlit date input widget, allowing the user to select a date range.
 
     The widget defaults to displaying the last 30 days from the current date.
+    The default range is computed once per session and kept in
+    `st.session_state`, rather than rebuilt on every rerun.
 
     Args:
         label (str): The label to display for the date input widget.
@@ -161,15 +201,17 @@ def date_range_selector(label: str) -> tuple[str, str]:
         tuple[str, str]: A tuple containing the selected start date and end date
                          as ISO formatted strings (`YYYY-MM-DD`).
     """
-    today = date.today()
-    default_start = today - timedelta(days=30)
-    selection = st.date_input(label, [default_start, today])
+    if "_date_range_default" not in st.session_state:
+        today = date.today()
+        st.session_state["_date_range_default"] = (today - timedelta(days=30), today)
+    default_start, default_end = st.session_state["_date_range_default"]
+    selection = st.date_input(label, [default_start, default_end])
     
     if isinstance(selection, (list, tuple)) and len(selection) == 2:
         start_date, end_date = selection
     else:
         # Fallback if only one date is selected or input is cleared
         start_date = default_start
-        end_date = today
+        end_date = default_end
         
     return start_date.isoformat(), end_date.isoformat()
\ No newline at end of file
@@ -11,7 +11,10 @@ conversion factors, localization strings, and other application-wide defaults.
 from __future__ import annotations # Added for type hinting consistency
 
 import os
-from typing import Callable, Any, TypedDict # Added TypedDict for more specific type hints
+from types import MappingProxyType
+
+import numpy as np
+from typing import Callable, Any, Mapping, TypedDict # Added TypedDict for more specific type hints
 
 # Path to the SQLite database file. It will be created in the project's root directory.
 # This ensures a consistent database location regardless of where the script is run from.
@@ -25,7 +28,7 @@ CO2_ON_SCHEDULE: tuple[int, int] = (9, 17) # CO2 typically on from 9 AM to 5 PM
 # These values serve as the default thresholds for determining "in-range" status
 # when no custom ranges are defined for a specific tank.
 # Format: "parameter_name": (safe_low_value, safe_high_value)
-SAFE_RANGES: dict[str, tuple[float, float]] = {
+SAFE_RANGES: Mapping[str, tuple[float, float]] = MappingProxyType({
     "temperature":   (18.0, 28.0), # Temperature in Celsius
     "ammonia":       (0.0, 0.0),   # Ammonia in parts per million (ppm) - ideally 0
     "nitrite":       (0.0, 0.0),   # Nitrite in ppm - ideally 0
@@ -34,24 +37,33 @@ SAFE_RANGES: dict[str, tuple[float, float]] = {
     "kh":            (4.0, 8.0),   # Carbonate Hardness in dKH (degrees of Carbonate Hardness)
     "gh":            (6.0, 10.0),  # General Hardness in dGH (degrees of General Hardness)
     "co2_indicator": (2.0, 2.0), # CO2 indicator value (conceptual for 'Green' state)
-}
+})
+
+# SAFE_RANGES as parallel, read-only arrays (same order as the dict) for
+# range-checking whole DataFrames in one vectorized comparison; see
+# `utils.validation.out_of_range_mask`.
+SAFE_RANGE_PARAMS: tuple[str, ...] = tuple(SAFE_RANGES)
+SAFE_RANGE_LOWS: np.ndarray = np.array([low for low, _ in SAFE_RANGES.values()], dtype=np.float64)
+SAFE_RANGE_HIGHS: np.ndarray = np.array([high for _, high in SAFE_RANGES.values()], dtype=np.float64)
+SAFE_RANGE_LOWS.setflags(write=False)
+SAFE_RANGE_HIGHS.setflags(write=False)
 
 # Thresholds below which a parameter is explicitly considered "too low"
 # for triggering specific warning messages and action plans.
 # These values are often the lower bound of the SAFE_RANGES, or a critical point.
-# Format: "parameter_name": threshold_value
-TOO_LOW_THRESHOLDS: dict[str, float] = {
+# Format: "parameter_name": threshold_value, read-only like the action plans
+TOO_LOW_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     "nitrate":       20.0,
     "kh":            4.0,
     "ph":            6.0,
     "co2_indicator": 2.0, # Corresponds to "Blue" indicator
-}
+})
 
 # Thresholds above which a parameter is explicitly considered "too high"
 # for triggering specific warning messages and action plans.
 # These values are often the upper bound of the SAFE_RANGES, or a critical point.
-# Format: "parameter_name": threshold_value
-TOO_HIGH_THRESHOLDS: dict[str, float] = {
+# Format: "parameter_name": threshold_value, read-only like the action plans
+TOO_HIGH_THRESHOLDS: Mapping[str, float] = MappingProxyType({
     "temperature":   28.0,
     "nitrite":       0.0,  # Any non-zero nitrite is too high
     "nitrate":       50.0,
@@ -60,71 +72,71 @@ TOO_HIGH_THRESHOLDS: dict[str, float] = {
     "gh":            10.0,
     "co2_indicator": 2.0,  # Corresponds to "Yellow" indicator
     "ammonia":       0.02, # Any non-zero unionized ammonia is too high (specific for calculation)
-}
+})
 
 # Action plans provided to the user when a parameter is detected as "too low".
 # These plans offer practical steps and advice.
-# Format: "parameter_name": [list_of_action_steps_as_strings]
-LOW_ACTION_PLANS: dict[str, list[str]] = {
-    "nitrate": [
+# Format: "parameter_name": (action_step, ...), read-only and shared by all sessions
+LOW_ACTION_PLANS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "nitrate": (
         "Nitrate is low (<20 ppm). Dose a nitrate fertilizer to reach the 20-40 ppm target range.",
         "If plants show deficiencies despite dosing, consider minor changes to feeding or livestock.",
-    ],
-    "co2_indicator": [
+    ),
+    "co2_indicator": (
         "CO₂ is low. Gradually increase the injection rate and ensure good circulation to improve mixing.",
-    ],
-    "kh": [
+    ),
+    "kh": (
         "KH is critically low (<4 dKH), which can lead to unstable pH. Dose an alkaline buffer to raise KH towards the 4-6 dKH range.",
         "Test KH daily after adjustments until it remains stable.",
-    ],
-    "ph": [
+    ),
+    "ph": (
         "pH is very low (<6.0). Use a neutral regulator or other buffer to gradually raise the pH, avoiding sudden changes that can shock livestock.",
-    ],
-    "gh": [
+    ),
+    "gh": (
         "GH is low (<6 dGH). Add a remineralizer (e.g., Seachem Equilibrium) to reach the 6-8 dGH target range.",
         "Test GH weekly after adjustments until stable.",
-    ],
-}
+    ),
+})
 
 # Action plans provided to the user when a parameter is detected as "too high".
 # These plans offer practical steps and advice.
-# Format: "parameter_name": [list_of_action_steps_as_strings]
-ACTION_PLANS: dict[str, list[str]] = {
-    "temperature": [
+# Format: "parameter_name": (action_step, ...), read-only and shared by all sessions
+ACTION_PLANS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "temperature": (
         "Temperature is high (>28°C). Turn off the aquarium heater and increase surface agitation for better oxygen exchange.",
         "If ambient room temperature is high, use a cooling fan or float sealed bottles of ice to gently lower the temperature.",
-    ],
-    "ammonia": [
+    ),
+    "ammonia": (
         "Ammonia is present. Perform an immediate 50% water change to reduce toxicity.",
         "Dose with FritzZyme 7 Live Nitrifying Bacteria: Use 4oz (119ml) per 10 US Gallons for new tanks, or 2oz (60ml) for established tanks.",
         "Consider using a detoxifier like Seachem Prime for immediate fish protection.",
         "Stop feeding for 24-48 hours and ensure the tank is well-aerated."
-    ],
-    "nitrite": [
+    ),
+    "nitrite": (
         "Nitrite is present (>0 ppm), which is highly toxic to fish. Perform a 30-50% water change.",
         "Dose with FritzZyme 7 Live Nitrifying Bacteria to accelerate processing: Use 4oz (119ml) per 10 US Gallons for new tanks, or 2oz (60ml) for established tanks.",
         "Ensure high aeration to maximize oxygen levels and support the bacteria."
-    ],
-    "nitrate": [
+    ),
+    "nitrate": (
         "Nitrate is high (>50 ppm). Perform a 30-50% water change to lower levels.",
         "To manage nitrates long-term, reduce feeding, add fast-growing plants, and ensure regular substrate cleaning.",
-    ],
-    "ph": [
+    ),
+    "ph": (
         "pH is high (>8.0). Perform partial water changes using softer water (like RO or rainwater) to lower it.",
         "Investigate and remove any alkaline-leaching decor, such as certain rocks or substrate.",
-    ],
-    "kh": [
+    ),
+    "kh": (
         "KH is high (>8 dKH), which can make pH difficult to lower. Pause the use of all buffering additives.",
         "Use reverse osmosis (RO) or rainwater for top-offs and water changes to gradually reduce KH.",
-    ],
-    "gh": [
+    ),
+    "gh": (
         "GH is high (>10 dGH). Stop dosing any remineralizing additives.",
         "Perform partial water changes with reverse osmosis (RO) or other soft water to dilute the mineral content.",
-    ],
-    "co2_indicator": [
+    ),
+    "co2_indicator": (
         "CO₂ is too high. Reduce the CO₂ injection rate and, if necessary, increase surface agitation to off-gas excess CO₂.",
-    ],
-}
+    ),
+})
 
 # Advice messages based on CO2 indicator color (e.g., from a drop checker).
 # These messages provide quick interpretation of the CO2 status in the aquarium.
@@ -138,8 +150,8 @@ CO2_COLOR_ADVICE: dict[str, str] = {
 # Localization strings for different locales.
 # This dictionary allows the application to display text in different languages.
 # Format: "locale_code": {"original_label": "translated_label"}
-LOCALIZATIONS: dict[str, dict[str, str]] = {
-    "en_US": {
+LOCALIZATIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "en_US": MappingProxyType({
         "Temperature":      "Temperature",
         "pH":               "pH",
         "Ammonia":          "Ammonia",
@@ -154,15 +166,15 @@ LOCALIZATIONS: dict[str, dict[str, str]] = {
         "out-of-range":     "out-of-range",
         "Dismiss Warning":  "Dismiss Warning",
         "Show Warning":     "Show Warning",
-    },
+    }),
     # Future: Add other languages here, e.g., "es_ES": {...}
-}
+})
 
 # Defines the display units for different parameters based on the selected unit system.
 # This ensures that numerical values are presented with the correct units (e.g., °C vs °F).
 # Format: "System_Name": {"parameter_name": "unit_string"}
-UNIT_SYSTEMS: dict[str, dict[str, str]] = {
-    "Metric": {
+UNIT_SYSTEMS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "Metric": MappingProxyType({
         "temperature":   "°C",
         "ammonia":       "ppm",
         "nitrite":       "ppm",
@@ -171,8 +183,8 @@ UNIT_SYSTEMS: dict[str, dict[str, str]] = {
         "kh":            "°dKH",
         "gh":            "°dGH",
         "co2_indicator": "",     # CO2 indicator is unitless (color-based)
-    },
-    "Imperial": {
+    }),
+    "Imperial": MappingProxyType({
         "temperature":   "°F",
         "ammonia":       "ppm",
         "nitrite":       "ppm",
@@ -181,19 +193,35 @@ UNIT_SYSTEMS: dict[str, dict[str, str]] = {
         "kh":            "°dKH",  # General Hardness used for KH in some imperial contexts
         "gh":            "°GH",
         "co2_indicator": "",
-    },
+    }),
     # Future: Add other unit systems as needed
-}
+})
+
+_C_TO_F_FACTOR: float = 9.0 / 5.0
+_F_TO_C_FACTOR: float = 5.0 / 9.0
+
+
+def _celsius_to_fahrenheit(c: Any) -> Any:
+    """Converts °C to °F. Accepts a scalar or a whole NumPy array / Pandas Series."""
+    return c * _C_TO_F_FACTOR + 32.0
+
+
+def _fahrenheit_to_celsius(f: Any) -> Any:
+    """Converts °F to °C. Accepts a scalar or a whole NumPy array / Pandas Series."""
+    return (f - 32.0) * _F_TO_C_FACTOR
+
 
 # Dictionary of conversion functions between different units.
-# Keys are tuples (from_unit, to_unit), values are lambda functions for conversion.
+# Keys are tuples (from_unit, to_unit), values are functions for conversion.
 # This enables seamless conversion between Metric and Imperial measurements.
-CONVERSIONS: dict[tuple[str, str], Callable[[float], float]] = {
-    ("°C", "°F"): lambda c: c * 9 / 5 + 32,
-    ("°F", "°C"): lambda f: (f - 32) * 5 / 9,
+# The functions are plain arithmetic, so callers converting a column should
+# pass the whole array or Series rather than converting cell by cell.
+CONVERSIONS: dict[tuple[str, str], Callable[[Any], Any]] = {
+    ("°C", "°F"): _celsius_to_fahrenheit,
+    ("°F", "°C"): _fahrenheit_to_celsius,
 }
 
-def get_low_action_plan(param: str) -> list[str]:
+def get_low_action_plan(param: str) -> tuple[str, ...]:
     """
     Retrieves the action plan for a parameter when its value is too low.
 
@@ -202,11 +230,11 @@ def get_low_action_plan(param: str) -> list[str]:
 
 
     Returns:
-        list[str]: A list of strings representing the action plan steps, or an empty list if no plan exists.
+        tuple[str, ...]: The action plan steps, or an empty tuple if no plan exists.
     """
-    return list(LOW_ACTION_PLANS.get(param, []))
+    return LOW_ACTION_PLANS.get(param, ())
 
-def get_high_action_plan(param: str) -> list[str]:
+def get_high_action_plan(param: str) -> tuple[str, ...]:
     """
     Retrieves the action plan for a parameter when its value is too high.
 
@@ -214,9 +242,43 @@ def get_high_action_plan(param: str) -> list[str]:
         param (str): The name of the parameter.
 
     Returns:
-        list[str]: A list of strings representing the action plan steps, or an empty list if no plan exists.
+        tuple[str, ...]: The action plan steps, or an empty tuple if no plan exists.
+    """
+    return ACTION_PLANS.get(param, ())
+
+# Each action plan joined into the one-line "step; step" form used by the
+# warning banners, built once here instead of on every banner render.
+_NO_PLAN_TEXT = "No plan available."
+LOW_ACTION_PLANS_TEXT: Mapping[str, str] = MappingProxyType(
+    {param: "; ".join(plan) for param, plan in LOW_ACTION_PLANS.items()}
+)
+ACTION_PLANS_TEXT: Mapping[str, str] = MappingProxyType(
+    {param: "; ".join(plan) for param, plan in ACTION_PLANS.items()}
+)
+
+def get_low_action_text(param: str) -> str:
+    """
+    Retrieves the one-line action plan for a parameter when its value is too low.
+
+    Args:
+        param (str): The name of the parameter.
+
+    Returns:
+        str: The plan's steps separated by "; ", or "No plan available." if no plan exists.
+    """
+    return LOW_ACTION_PLANS_TEXT.get(param, _NO_PLAN_TEXT)
+
+def get_high_action_text(param: str) -> str:
+    """
+    Retrieves the one-line action plan for a parameter when its value is too high.
+
+    Args:
+        param (str): The name of the parameter.
+
+    Returns:
+        str: The plan's steps separated by "; ", or "No plan available." if no plan exists.
     """
-    return list(ACTION_PLANS.get(param, []))
+    return ACTION_PLANS_TEXT.get(param, _NO_PLAN_TEXT)
 
 # Define TypedDicts for structured type hinting of WEEKLY_EMAIL_TIME
 class SmtpSettings(TypedDict):
@@ -137,18 +137,17 @@ def render_edit_tank_section(tank_map: Dict[int, TankRecord], tank_repo: TankRep
 
         if st.button("Save Changes", key="save_tank_changes_btn"):
             try:
-                changes_made = False
+                changes: Dict[str, Any] = {}
                 if new_name.strip() != current["name"]:
-                    tank_repo.rename(tid, new_name.strip())
-                    changes_made = True
+                    changes["name"] = new_name.strip()
                 if (current.get("volume_l") or 0) != new_vol:
-                    tank_repo.update_volume(tid, new_vol)
-                    changes_made = True
+                    changes["volume_l"] = new_vol
                 if current.get("has_co2", True) != has_co2_edit:
-                    tank_repo.set_co2_status(tid, has_co2_edit)
-                    changes_made = True
+                    changes["has_co2"] = has_co2_edit
 
-                if changes_made:
+                if changes:
+                    # Apply all edits in one UPDATE / transaction.
+                    tank_repo.update(tid, **changes)
                     st.success(f"✅ Updated tank to '{new_name.strip()}' ({new_vol} L).")
                     request_rerun()
                 else:
@@ -307,15 +306,12 @@ def render_clear_tests_section(tid: int, tank_map: Dict[int, TankRecord]) -> Non
         col_yes, col_cancel = st.columns(2)
         with col_yes:
             if confirm and st.button("Yes, delete all", key=yes_key):
-                with get_connection() as conn:
-                    try:
-                        conn.execute("DELETE FROM water_tests WHERE tank_id = ?;", (tid,))
-                        conn.commit()
-                        st.success(f"✅ All tests for '{name}' deleted.")
-                    except sqlite3.Error as e:
-                        st.error(f"❌ Error deleting tests: {e}")
-                        conn.rollback()
-                        st.exception(e)
+                try:
+                    WaterTestRepository().delete_for_tank(tid)
+                    st.success(f"✅ All tests for '{name}' deleted.")
+                except (ValueError, RuntimeError) as e:
+                    st.error(f"❌ Error deleting tests: {e}")
+                    st.exception(e)
                 st.session_state.pop(flag_key, None)
                 request_rerun()
         with col_cancel:
@@ -359,6 +355,9 @@ def render_csv_import_section(tank_map: Dict[int, TankRecord]) -> None:
                 return
 
             df["tank_id"] = tid
+            # Keep the integer date copy used by range queries in step with `date`
+            # (naive times read as UTC, as WaterTestRepository does).
+            df["date_epoch"] = (pd.to_datetime(df["date"], format="ISO8601") - pd.Timestamp(0)) // pd.Timedelta(seconds=1)
             
             with get_connection() as conn:
                 cursor = conn.cursor()
@@ -371,12 +370,9 @@ def render_csv_import_section(tank_map: Dict[int, TankRecord]) -> None:
                 st.warning("⚠️ No recognized data columns found in the CSV to import. Check CSV headers against expected water test parameters.")
                 return
 
-            with get_connection() as conn:
-                for d in df_to_insert["date"].unique():
-                    conn.execute("DELETE FROM water_tests WHERE date = ? AND tank_id = ?;", (d, tid))
-                
-                df_to_insert.to_sql("water_tests", conn, if_exists="append", index=False)
-                conn.commit()
+            # Replaces the tank's tests on the imported dates and clears the
+            # repository's cached reads.
+            WaterTestRepository().replace_from_frame(df_to_insert, tid)
             
             st.success(f"✅ Imported {len(df_to_insert)} records into '{tank_map[tid]['name']}'.")
             request_rerun()
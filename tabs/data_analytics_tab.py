@@ -26,7 +26,10 @@ from config import SAFE_RANGES
 # ======================================================================================
 # MODULAR RENDER FUNCTIONS FOR EACH PANEL
 # ======================================================================================
+# Panels with their own parameter pickers are Streamlit fragments: changing a
+# picker reruns only that panel, not the data load and every other panel.
 
+@st.fragment
 def render_interactive_dashboard(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders an interactive dashboard with cross-filtering capabilities using Altair.
@@ -134,6 +137,7 @@ def render_raw_data_table(vis_df: pd.DataFrame, tank_name: str, start_date: date
             use_container_width=True,
         )
 
+@st.fragment
 def render_rolling_averages(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders a line chart showing 30-day rolling averages for selected numeric parameters.
@@ -172,6 +176,7 @@ def render_rolling_averages(vis_df: pd.DataFrame, numeric_params: List[str]) ->
         else:
             st.info("No numeric parameters with sufficient data to compute rolling averages based on your selection.")
 
+@st.fragment
 def render_correlation_matrix(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders a correlation matrix for selected numeric parameters.
@@ -197,6 +202,7 @@ def render_correlation_matrix(vis_df: pd.DataFrame, numeric_params: List[str]) -
         except Exception as e:
             st.error(f"Unable to compute correlation matrix. Ensure there is enough variance in the data and no missing values for selected parameters. Error: {e}")
 
+@st.fragment
 def render_scatter_regression(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders a scatter plot with an optional linear regression line between two selected parameters.
@@ -235,6 +241,7 @@ def render_scatter_regression(vis_df: pd.DataFrame, numeric_params: List[str]) -
         else:
             st.write("Not enough data for scatter/regression plot after dropping missing values for selected parameters.")
 
+@st.fragment
 def render_forecast(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders a 7-day forecast for selected water parameters using Exponential Smoothing.
@@ -295,6 +302,7 @@ def render_forecast(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
         else:
             st.info("No forecast can be displayed with current selections or data.")
 
+@st.fragment
 def render_anomaly_detection(vis_df: pd.DataFrame, numeric_params: List[str]) -> None:
     """
     Renders an anomaly detection chart for selected water parameters.
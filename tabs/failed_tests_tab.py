@@ -11,16 +11,21 @@ from __future__ import annotations
 import datetime as _dt
 import pandas as _pd
 import streamlit as st
+from pandas.io.formats.style import Styler
 
 # 1. Import repositories instead of legacy functions
 from aqualog_db.repositories import TankRepository, WaterTestRepository
 
-from utils import clean_numeric_df, is_mobile, translate, format_with_units
+from utils import clean_numeric_df, is_mobile, translate, format_series_with_units, out_of_range_mask
 from config import SAFE_RANGES
 from components import highlight_out_of_range
 
 # Removed debug print statement: print(">>> LOADING", __file__,)
 
+# Rows shown (and styled) in the failed tests table; older failures beyond
+# this are summarised in a caption instead.
+FAILED_TESTS_MAX_ROWS = 500
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Helper – get tank‑scoped dataframe of *failed* tests only
 # ─────────────────────────────────────────────────────────────────────────────
@@ -66,16 +71,66 @@ def _load_failed_tests(tank_id: int | None) -> _pd.DataFrame:
         if col in numeric_df.columns:
             numeric_df[col] = _pd.to_numeric(numeric_df[col], errors='coerce')
 
-    # Initialize a boolean mask to identify rows with any out-of-range value.
-    mask = _pd.Series(False, index=numeric_df.index)
-    # Iterate through each parameter and its safe range to build the mask.
-    for col, (low, high) in SAFE_RANGES.items():
-        if col in numeric_df.columns:
-            # Check if value is less than low OR greater than high.
-            mask |= (numeric_df[col] < low) | (numeric_df[col] > high)
+    # A row fails if any of its parameters is outside its safe range; all
+    # parameters are checked in a single vectorized comparison.
+    mask = out_of_range_mask(numeric_df).any(axis=1)
             
     return numeric_df[mask] # Return only the rows that are out of range
 
+def _failed_tests_table(df_failed: _pd.DataFrame) -> tuple[Styler, dict]:
+    """
+    Builds the display table for the failed tests: newest first, with
+    unit-formatted readings, localized headers and out-of-range cells
+    highlighted.
+
+    Args:
+        df_failed (_pd.DataFrame): The failed tests, as returned by `_load_failed_tests`.
+
+    Returns:
+        tuple[Styler, dict]: The styled table, limited to `FAILED_TESTS_MAX_ROWS`
+                             rows, and the `column_config` for `st.dataframe`.
+    """
+    # Newest tests first, so that the most recent failures survive the
+    # table's row limit.
+    readings = df_failed.iloc[::-1]
+    display_df = readings.copy()
+
+    # Format specific columns with units for better readability.
+    # Each column is unit-converted in one vectorized step by `format_series_with_units`.
+    for param in ("temperature", "gh", "kh"):
+        if param in display_df.columns:
+            display_df[param] = format_series_with_units(display_df[param], param)
+
+    # Localize and rename headers for display, using the `translate` utility.
+    rename_map = {c: translate(c.capitalize()) for c in display_df.columns}
+    # Specific override for GH and KH display labels for consistent unit notation.
+    if "gh" in rename_map:
+        rename_map["gh"] = "GH (°dH)"
+    if "kh" in rename_map:
+        rename_map["kh"] = "KH (°dKH)"
+    # Apply renaming to the display DataFrame.
+    display_df.rename(columns=rename_map, inplace=True)
+
+    # Highlight out-of-range cells. The check runs on the raw readings under
+    # the display headers, since the unit-formatted text cannot be compared.
+    display_ranges = {rename_map[param]: SAFE_RANGES[param] for param in SAFE_RANGES if param in rename_map}
+    styled = highlight_out_of_range(
+        display_df,
+        display_ranges,
+        max_rows=FAILED_TESTS_MAX_ROWS,
+        values=readings.rename(columns=rename_map),
+    )
+
+    # Number formatting is left to the grid via column_config rather than the
+    # Styler, which then only carries the out-of-range cell colours.
+    numeric_cols = set(display_df.select_dtypes("number").columns)
+    column_config = {
+        rename_map[param]: st.column_config.NumberColumn(format="%.2f")
+        for param in SAFE_RANGES
+        if rename_map.get(param) in numeric_cols
+    }
+    return styled, column_config
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Streamlit tab renderer
 # ─────────────────────────────────────────────────────────────────────────────
@@ -111,41 +166,16 @@ def failed_tests_tab() -> None:
         st.info(translate("No out‑of‑range water tests for") + f" {tank_name}.")
         return
 
-    # Prepare a copy of the DataFrame for display purposes.
-    display_df = df_failed.copy()
-    
-    # Format specific columns with units for better readability.
-    # Applies `format_with_units` helper to temperature, GH, and KH columns.
-    if "temperature" in display_df.columns:
-        display_df["temperature"] = display_df["temperature"].apply(
-            lambda v: format_with_units(v, "temperature") if _pd.notnull(v) else "N/A"
+    styled, column_config = _failed_tests_table(df_failed)
+    if len(df_failed) > FAILED_TESTS_MAX_ROWS:
+        st.caption(
+            translate("Showing the latest") + f" {FAILED_TESTS_MAX_ROWS} / {len(df_failed)}"
         )
-    if "gh" in display_df.columns:
-        display_df["gh"] = display_df["gh"].apply(
-            lambda v: format_with_units(v, "gh") if _pd.notnull(v) else "N/A"
-        )
-    if "kh" in display_df.columns:
-        display_df["kh"] = display_df["kh"].apply(
-            lambda v: format_with_units(v, "kh") if _pd.notnull(v) else "N/A"
-        )
-
-    # Localize and rename headers for display, using the `translate` utility.
-    rename_map = {c: translate(c.capitalize()) for c in display_df.columns}
-    # Specific override for GH and KH display labels for consistent unit notation.
-    if "gh" in rename_map:
-        rename_map["gh"] = "GH (°dH)"
-    if "kh" in rename_map:
-        rename_map["kh"] = "KH (°dKH)"
-    # Apply renaming to the display DataFrame.
-    display_df.rename(columns=rename_map, inplace=True)
-
-    # Apply conditional highlighting to out-of-range cells in the DataFrame using `highlight_out_of_range`.
-    styled = highlight_out_of_range(display_df, SAFE_RANGES)
 
     # Display the styled table.
     # On mobile devices, the table is wrapped in an expander for better screen real estate management.
     if is_mobile():
         with st.expander(translate("Show Failed Tests"), expanded=False):
-            st.dataframe(styled, use_container_width=True)
+            st.dataframe(styled, use_container_width=True, column_config=column_config)
     else:
-        st.dataframe(styled, use_container_width=True)
\ No newline at end of file
+        st.dataframe(styled, use_container_width=True, column_config=column_config)
\ No newline at end of file
@@ -121,7 +121,7 @@ def maintenance_tab() -> None:
     st.subheader("➕ Add New Maintenance Entry")
     
     # Fetch active cycles to allow linking new entries to a cycle.
-    active_cycles: List[MaintenanceCycleRecord] = [c for c in maintenance_repo.fetch_maintenance_cycles(tank_id) if c['is_active']] # Explicitly type active_cycles
+    active_cycles: List[MaintenanceCycleRecord] = maintenance_repo.fetch_maintenance_cycles(tank_id, active_only=True) # Explicitly type active_cycles
     
     # Initialize selected_cycle_id outside the conditional block
     selected_cycle_id = None 
@@ -17,7 +17,7 @@ import pandas as pd
 import streamlit as st
 
 from aqualog_db.connection import get_connection
-from config import SAFE_RANGES, ACTION_PLANS, LOW_ACTION_PLANS
+from config import SAFE_RANGES, ACTION_PLANS, LOW_ACTION_PLANS, get_low_action_text, get_high_action_text
 from utils import calculate_alkaline_buffer_dose, calculate_equilibrium_dose, calculate_fritzzyme7_dose
 from utils.localization import format_with_units
 from utils.validation import is_out_of_range
@@ -46,13 +46,11 @@ def _build_banner_details(param: str, value: float, low: float, high: float) ->
     associated action plan for display in warning banners or advice cards.
     """
     if value < low:
-        plan = LOW_ACTION_PLANS.get(param, ["No plan available."])
         return (f"- **{param.upper()}**: Too low ({format_with_units(value, param)} < "
-                f"{format_with_units(low, param)}); " + "; ".join(plan))
+                f"{format_with_units(low, param)}); " + get_low_action_text(param))
     
-    plan = ACTION_PLANS.get(param, ["No plan available."])
     return (f"- **{param.upper()}**: Too high ({format_with_units(value, param)} > "
-            f"{format_with_units(high, param)}); " + "; ".join(plan))
+            f"{format_with_units(high, param)}); " + get_high_action_text(param))
 
 
 def show_parameter_advice(param: str, value: float) -> None:
@@ -241,7 +239,7 @@ def warnings_tab(key_prefix: str = "") -> None:
                     
                     for low_item in warning['low_warnings']:
                         param, value = low_item['param'], low_item['value']
-                        plan_list: List[str] = LOW_ACTION_PLANS.get(param, []).copy()
+                        plan_list: List[str] = list(LOW_ACTION_PLANS.get(param, ()))
                         if volume_l and volume_l > 0 and param not in ['co2_indicator'] and isinstance(value, (float, int)):
                             if param == 'kh':
                                 safe_low_kh, _ = SAFE_RANGES.get('kh', (4.0, 8.0))
@@ -257,7 +255,7 @@ def warnings_tab(key_prefix: str = "") -> None:
                     
                     for high_item in warning['high_warnings']:
                         param, value = high_item['param'], high_item['value']
-                        plan_list: List[str] = ACTION_PLANS.get(param, []).copy()
+                        plan_list: List[str] = list(ACTION_PLANS.get(param, ()))
                         if volume_l and volume_l > 0 and param in ['ammonia', 'nitrite'] and isinstance(value, (float, int)):
                             dose_ml, dose_oz = calculate_fritzzyme7_dose(volume_l, is_new_system=True)
                             plan_list.insert(1, f"**Dosage:** For your {volume_l:.0f}L tank, dose **{dose_ml:.0f}ml / {dose_oz:.1f}oz** of FritzZyme 7.")
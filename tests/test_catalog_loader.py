@@ -0,0 +1,94 @@
+import sys, sqlite3, pathlib
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import catalog_loader
+
+SCHEMA = """
+    CREATE TABLE fish (
+        fish_id  INTEGER PRIMARY KEY,
+        name     TEXT NOT NULL,
+        max_cm   REAL
+    );
+"""
+COLUMNS = (("id", "fish_id", int), ("Name", "name", None), ("Size", "max_cm", float))
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Points catalog_loader at a fresh database file in tmp_path."""
+    path = tmp_path / "aqualog.db"
+    monkeypatch.setattr(catalog_loader, "DB_PATH", path)
+    return path
+
+
+def _write_csv(path, rows):
+    path.write_text("id,Name,Size\n" + "".join(f"{i},Fish {i},{size}\n" for i, size in rows), encoding="utf-8")
+    return path
+
+
+def _rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT fish_id, name, max_cm FROM fish ORDER BY fish_id").fetchall()
+
+
+@pytest.mark.parametrize("max_params, n_rows, batches", [
+    # Three columns: batches of 999 // 3 rows, then of 9 // 3.
+    (catalog_loader.MAX_SQL_PARAMS, 700, [333, 333, 34]),
+    (9, 7, [3, 3, 1]),
+])
+def test_load_inserts_in_multi_row_batches(tmp_path, db_path, monkeypatch, max_params, n_rows, batches):
+    monkeypatch.setattr(catalog_loader, "MAX_SQL_PARAMS", max_params)
+    inserts = []
+    connect = sqlite3.connect
+
+    def traced_connect(path, *args, **kwargs):
+        conn = connect(path, *args, **kwargs)
+        if path == db_path:
+            # The traced SQL has the values bound; count the row tuples.
+            conn.set_trace_callback(lambda sql: sql.startswith("INSERT") and inserts.append(sql.count("), (") + 1))
+        return conn
+    monkeypatch.setattr(catalog_loader.sqlite3, "connect", traced_connect)
+
+    csv_path = _write_csv(tmp_path / "fish.csv", [(i, "" if i == 4 else i * 1.5) for i in range(1, n_rows + 1)])
+    catalog_loader.load("fish", SCHEMA, csv_path, COLUMNS)
+
+    assert inserts == batches
+    rows = _rows(db_path)
+    assert len(rows) == n_rows
+    # Numeric fields are cast, and blank ones stored as NULL.
+    assert rows[0] == (1, "Fish 1", 1.5) and rows[3] == (4, "Fish 4", None)
+
+
+def test_load_empties_matching_table_and_rebuilds_changed_one(tmp_path, db_path, capsys):
+    csv_path = _write_csv(tmp_path / "fish.csv", [(1, 2.0), (2, 3.0)])
+    catalog_loader.load("fish", SCHEMA, csv_path, COLUMNS)
+    assert "Dropping old 'fish' table" in capsys.readouterr().out
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE INDEX idx_fish_name ON fish(name)")
+
+    # Same schema: the table is emptied in place, so the index survives.
+    _write_csv(csv_path, [(3, 4.0)])
+    catalog_loader.load("fish", SCHEMA, csv_path, COLUMNS)
+    assert "Clearing the existing 'fish' table" in capsys.readouterr().out
+    assert _rows(db_path) == [(3, "Fish 3", 4.0)]
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'idx_fish_name'").fetchone()
+
+    # Changed schema: the table is dropped and re-created from schema_sql.
+    changed = SCHEMA.replace("max_cm   REAL", "max_cm   REAL,\n        notes    TEXT")
+    catalog_loader.load("fish", changed, csv_path, COLUMNS)
+    assert "Dropping old 'fish' table" in capsys.readouterr().out
+    assert _rows(db_path) == [(3, "Fish 3", 4.0)]
+    with sqlite3.connect(db_path) as conn:
+        assert "notes" in [r[1] for r in conn.execute("PRAGMA table_info(fish)")]
+        assert not conn.execute("SELECT name FROM sqlite_master WHERE name = 'idx_fish_name'").fetchone()
+
+
+def test_load_reports_missing_csv_without_touching_database(tmp_path, db_path, capsys):
+    catalog_loader.load("fish", SCHEMA, tmp_path / "missing.csv", COLUMNS)
+    assert "Could not find missing.csv" in capsys.readouterr().out
+    assert not db_path.exists()
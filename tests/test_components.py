@@ -0,0 +1,56 @@
+import sys, pathlib
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+# Other test modules install a bare streamlit stub; the tab needs the real
+# module (st.column_config), so the stub is set aside while it is imported.
+_stub = sys.modules.pop("streamlit", None)
+try:
+    from components import OUT_OF_RANGE_CSS, highlight_out_of_range
+    try:
+        from tabs.failed_tests_tab import _failed_tests_table
+    except ImportError:  # tabs and utils need statsmodels and scikit-learn
+        _failed_tests_table = None
+finally:
+    if _stub is not None:
+        sys.modules["streamlit"] = _stub
+
+
+# OUT_OF_RANGE_CSS as the (property, value) pairs a computed Styler holds.
+HIGHLIGHT = [tuple(part.strip() for part in decl.split(":")) for decl in OUT_OF_RANGE_CSS.split(";") if decl.strip()]
+
+
+def _cell_css(styled):
+    styled._compute()
+    return {cell: css for cell, css in styled.ctx.items() if css}
+
+
+def test_highlight_out_of_range_checks_raw_values():
+    readings = pd.DataFrame({"Ph": [7.0, 9.5], "Temperature": [25.0, 30.0]})
+    # Displayed cells are formatted text; the raw readings are range-checked.
+    display = pd.DataFrame({"Ph": [7.0, 9.5], "Temperature": ["25.0 °C", "30.0 °C"]})
+    styled = highlight_out_of_range(
+        display, {"Ph": (6.0, 8.0), "Temperature": (18.0, 28.0)}, values=readings
+    )
+    css = _cell_css(styled)
+    assert css == {(1, 0): HIGHLIGHT, (1, 1): HIGHLIGHT}
+
+
+@pytest.mark.skipif(_failed_tests_table is None, reason="statsmodels or scikit-learn not installed")
+def test_failed_tests_table_highlights_cells():
+    df_failed = pd.DataFrame({
+        "id": [1, 2], "date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "ph": [9.5, 7.0], "temperature": [25.0, 35.0], "gh": [7.0, 7.0],
+        "kh": [5.0, 5.0], "co2_indicator": ["Green", "Green"], "tank_id": [1, 1],
+    })
+    styled, _ = _failed_tests_table(df_failed)
+    assert HIGHLIGHT in _cell_css(styled).values()
+
+
+def test_highlight_out_of_range_keeps_all_rows_by_default():
+    df = pd.DataFrame({"ph": [7.0] * 600 + [9.0]})
+    assert len(highlight_out_of_range(df, {"ph": (6.0, 8.0)}).data) == 601
+    assert len(highlight_out_of_range(df, {"ph": (6.0, 8.0)}, max_rows=500).data) == 500
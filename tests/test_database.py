@@ -0,0 +1,406 @@
+import sys, sqlite3, pathlib
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from aqualog_db import connection, init_tables
+from aqualog_db import schema
+from aqualog_db.schema import SchemaManager
+from aqualog_db.repositories import water_test
+from aqualog_db.repositories.water_test import WaterTestRepository
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Points every module that opens aqualog.db at a fresh file in tmp_path."""
+    path = str(tmp_path / "aqualog.db")
+    for module in (connection, water_test):
+        monkeypatch.setattr(module, "DB_FILE", path)
+    connection.close_all_connections()
+    WaterTestRepository._invalidate_read_cache()
+    yield path
+    connection.close_all_connections()
+    WaterTestRepository._invalidate_read_cache()
+
+
+def _water_tests(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT date, ph, gh, notes FROM water_tests ORDER BY date").fetchall()
+
+
+def test_save_many_inserts_chunks_and_remainder(db_path):
+    init_tables()
+    # 120 rows: two full multi-row INSERT chunks plus an executemany remainder.
+    records = [{"date": f"2024-01-01T{i // 60:02d}:{i % 60:02d}:00", "ph": 7.0} for i in range(120)]
+    records[5] = {"date": records[5]["date"], "ph": "", "notes": "  "}
+
+    assert WaterTestRepository().save_many(records, 1) == 120
+    rows = _water_tests(db_path)
+    assert len(rows) == 120
+    # Blank and omitted parameters and blank notes are stored as NULL.
+    assert rows[5] == (records[5]["date"], None, None, None)
+    assert rows[119] == (records[119]["date"], 7.0, None, None)
+
+
+def test_save_many_rolls_back_whole_batch(db_path):
+    init_tables()
+    records = [{"date": f"2024-02-01T10:{i:02d}:00", "ph": 7.0} for i in range(60)]
+    records[55]["ph"] = 15
+
+    with pytest.raises(ValueError):
+        WaterTestRepository().save_many(records, 1)
+    records[55]["ph"] = "nan"
+    with pytest.raises(ValueError):
+        WaterTestRepository().save_many(records, 1)
+    records[55]["ph"] = 7.0
+    with pytest.raises(ValueError):
+        WaterTestRepository().save_many(records, 99)
+    assert _water_tests(db_path) == []
+
+    # A row that only the database rejects, in the executemany remainder,
+    # also undoes the multi-row chunk already inserted before it.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TRIGGER reject_boom BEFORE INSERT ON water_tests "
+            "WHEN NEW.notes = 'boom' BEGIN SELECT RAISE(ABORT, 'boom'); END;"
+        )
+    records[55]["notes"] = "boom"
+    with pytest.raises(RuntimeError):
+        WaterTestRepository().save_many(records, 1)
+    assert _water_tests(db_path) == []
+
+
+# Tables as created by the first release of aqualog_db/schema.py, before the
+# custom_ranges, plants and water_tests rebuilds and the date_epoch column.
+BASELINE_SCHEMA = """
+    CREATE TABLE tanks (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        name        TEXT    NOT NULL CHECK(length(trim(name)) > 0),
+        volume_l    REAL    CHECK(volume_l IS NULL OR volume_l >= 0),
+        start_date  TEXT,
+        notes       TEXT,
+        has_co2     BOOLEAN DEFAULT 1,
+        co2_on_hour INTEGER CHECK(co2_on_hour >= 0 AND co2_on_hour <= 23),
+        co2_off_hour INTEGER CHECK(co2_off_hour >= 0 AND co2_off_hour <= 23),
+        created_at  TEXT DEFAULT (datetime('now')),
+        updated_at  TEXT DEFAULT (datetime('now'))
+    );
+    CREATE TABLE water_tests (
+        id            INTEGER PRIMARY KEY,
+        date          TEXT    NOT NULL CHECK(date != ''),
+        ph            REAL    CHECK(ph >= 0 AND ph <= 14),
+        ammonia       REAL    CHECK(ammonia >= 0 AND ammonia <= 100),
+        nitrite       REAL    CHECK(nitrite >= 0 AND nitrite <= 100),
+        nitrate       REAL    CHECK(nitrate >= 0 AND nitrate <= 100),
+        temperature   REAL    CHECK(temperature >= 0 AND temperature <= 40),
+        kh            REAL    DEFAULT 0 CHECK(kh >= 0 AND kh <= 30),
+        co2_indicator TEXT    CHECK(co2_indicator IN ('Green', 'Blue', 'Yellow')),
+        gh            REAL    DEFAULT 0 CHECK(gh >= 0 AND gh <= 30),
+        tank_id       INTEGER NOT NULL,
+        notes         TEXT,
+        FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
+    );
+    CREATE TABLE plants (
+        plant_id      INTEGER PRIMARY KEY,
+        plant_name    TEXT    NOT NULL CHECK(length(trim(plant_name)) > 0),
+        origin        TEXT,
+        origin_info   TEXT,
+        growth_rate   TEXT,
+        growth_info   TEXT,
+        height_cm     TEXT,
+        height_info   TEXT,
+        light_demand  TEXT,
+        light_info    TEXT,
+        co2_demand    TEXT,
+        co2_info      TEXT,
+        thumbnail_url TEXT,
+        created_at    TEXT    DEFAULT (datetime('now')),
+        updated_at    TEXT    DEFAULT (datetime('now'))
+    );
+    CREATE TABLE owned_plants (
+        plant_id     INTEGER NOT NULL,
+        tank_id      INTEGER NOT NULL,
+        common_name  TEXT,
+        quantity     INTEGER DEFAULT 1,
+        created_at   TEXT    DEFAULT (datetime('now')),
+        PRIMARY KEY (plant_id, tank_id),
+        FOREIGN KEY (plant_id) REFERENCES plants(plant_id) ON DELETE CASCADE,
+        FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
+    );
+    CREATE TABLE custom_ranges (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        tank_id     INTEGER NOT NULL,
+        parameter   TEXT    NOT NULL CHECK(parameter IN ('ph','ammonia','nitrite','nitrate','kh','gh','temperature')),
+        safe_low    REAL    NOT NULL,
+        safe_high   REAL    NOT NULL CHECK(safe_high > safe_low),
+        created_at  TEXT    DEFAULT (datetime('now')),
+        updated_at  TEXT    DEFAULT (datetime('now')),
+        UNIQUE(tank_id, parameter),
+        FOREIGN KEY (tank_id) REFERENCES tanks(id) ON DELETE CASCADE
+    );
+    CREATE INDEX idx_water_tests_date ON water_tests(date);
+    CREATE INDEX idx_water_tests_tank_id ON water_tests(tank_id);
+    CREATE INDEX idx_custom_ranges_tank_id ON custom_ranges(tank_id);
+    CREATE INDEX idx_owned_plants_tank_id ON owned_plants(tank_id);
+
+    INSERT INTO tanks (id, name) VALUES (1, 'Main'), (2, 'Shrimp');
+    INSERT INTO water_tests (date, ph, kh, gh, tank_id, notes) VALUES
+        ('2024-01-01T10:00:00', 7.0, 4, 6, 1, 'first'),
+        ('2024-01-02T10:00:00', 6.8, NULL, NULL, 2, NULL);
+    INSERT INTO plants (plant_id, plant_name) VALUES (10, 'Anubias'), (11, 'Java Fern');
+    INSERT INTO owned_plants (plant_id, tank_id, quantity) VALUES (10, 1, 3), (11, 2, 1);
+    INSERT INTO custom_ranges (tank_id, parameter, safe_low, safe_high) VALUES (1, 'ph', 6.5, 7.5);
+"""
+
+
+def test_init_tables_migrates_baseline_database(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(BASELINE_SCHEMA)
+
+    SchemaManager().init_tables()
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute(
+            "SELECT date, ph, kh, gh, tank_id, notes, date_epoch FROM water_tests ORDER BY id"
+        ).fetchall() == [
+            ("2024-01-01T10:00:00", 7.0, 4.0, 6.0, 1, "first", 1704103200),
+            ("2024-01-02T10:00:00", 6.8, None, None, 2, None, 1704189600),
+        ]
+        assert conn.execute("SELECT plant_id, plant_name FROM plants ORDER BY plant_id").fetchall() == [
+            (10, "Anubias"), (11, "Java Fern"),
+        ]
+        assert conn.execute("SELECT plant_id, tank_id, quantity FROM owned_plants ORDER BY plant_id").fetchall() == [
+            (10, 1, 3), (11, 2, 1),
+        ]
+        assert conn.execute("SELECT tank_id, parameter, safe_low, safe_high FROM custom_ranges").fetchall() == [
+            (1, "ph", 6.5, 7.5),
+        ]
+        tables = {r[0]: " ".join(r[1].split()) for r in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+        )}
+        assert "owned_plants" in tables and not any(name.endswith("__new") for name in tables)
+        assert ("STRICT" in tables["plants"]) == schema.STRICT_SUPPORTED
+        assert "WITHOUT ROWID" in tables["custom_ranges"]
+        assert conn.execute("PRAGMA foreign_key_check;").fetchall() == []
+        schema_version = conn.execute("PRAGMA schema_version;").fetchone()[0]
+
+    # The database is now stamped with the current schema, so a second run
+    # changes nothing.
+    SchemaManager().init_tables()
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA schema_version;").fetchone()[0] == schema_version
+        assert conn.execute("SELECT COUNT(*) FROM water_tests").fetchone()[0] == 2
+
+
+def test_table_options_drop_strict_on_old_sqlite(monkeypatch):
+    monkeypatch.setattr(schema, "STRICT_SUPPORTED", False)
+    assert schema.table_options("WITHOUT ROWID", "STRICT") == "WITHOUT ROWID"
+    assert schema.table_options("STRICT") == ""
+    # The SQL built without STRICT is accepted (3.37+ would also accept it).
+    with sqlite3.connect(":memory:") as conn:
+        conn.execute(f"CREATE TABLE t (a INTEGER PRIMARY KEY) {schema.table_options('WITHOUT ROWID', 'STRICT')};")
+        conn.execute(f"CREATE TABLE u (a INTEGER) {schema.table_options('STRICT')};")
+
+
+def test_repositories_share_the_connection_pool(db_path):
+    init_tables()
+    connection.close_all_connections()
+    WaterTestRepository().fetch_scalar("SELECT COUNT(*) FROM water_tests")
+    # The repository's connection went back to the pool get_connection uses.
+    assert connection._pool.qsize() == 1
+    with connection.get_connection() as conn:
+        assert connection._pool.qsize() == 0
+        assert conn.execute("PRAGMA foreign_keys;").fetchone()[0] == 1
+    assert connection._pool.qsize() == 1
+
+
+def test_reader_connections_are_reused_read_only_and_see_commits(db_path):
+    init_tables()
+    count = "SELECT COUNT(*) FROM water_tests"
+    with connection.get_reader_connection() as reader:
+        assert reader.execute("PRAGMA query_only;").fetchone()[0] == 1
+        assert reader.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        assert reader.execute(count).fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO tanks (name) VALUES ('Nope')")
+
+    with connection.get_connection() as writer:
+        writer.execute("INSERT INTO water_tests (date, ph, tank_id) VALUES ('2024-06-01T09:00:00', 7.0, 1)")
+        # Under WAL an open write transaction does not block readers, which
+        # keep seeing the last committed state.
+        with connection.get_reader_connection() as other:
+            assert other is reader
+            assert other.execute(count).fetchone()[0] == 0
+        writer.commit()
+
+    with connection.get_reader_connection() as again:
+        assert again is reader
+        assert again.execute(count).fetchone()[0] == 1
+    assert connection._reader_pool.qsize() == 1
+
+
+def test_get_latest_follows_deletes_and_imports(db_path, monkeypatch):
+    init_tables()
+    # A frozen stamp stands in for a filesystem whose mtimes do not change
+    # between writes, so only explicit cache invalidation can refresh reads.
+    monkeypatch.setattr(water_test, "_db_stamp", lambda: (0, 0))
+    repo = WaterTestRepository()
+    repo.save({"date": "2024-03-01T10:00:00", "ph": 7.0}, 1)
+    assert repo.get_latest()["ph"] == 7.0
+
+    assert repo.delete_for_tank(1) == 1
+    assert repo.get_latest() is None
+
+    imported = pd.DataFrame({
+        "date": ["2024-03-02T10:00:00", "2024-03-03T10:00:00"],
+        "ph": [6.5, 6.8], "tank_id": [1, 1], "date_epoch": [1709373600, 1709460000],
+    })
+    assert repo.replace_from_frame(imported, 1) == 2
+    assert repo.get_latest()["ph"] == 6.8
+
+    # Re-importing a date replaces the test recorded on it.
+    assert repo.replace_from_frame(imported.iloc[1:].assign(ph=7.2), 1) == 1
+    assert repo.get_latest()["ph"] == 7.2
+    assert len(repo.fetch_by_date_range("2024-01-01T00:00:00", "2024-12-31T23:59:59", 1)) == 2
+
+
+def test_fetch_by_date_range_reads_rows_without_epoch(db_path):
+    init_tables()
+    # A row written before date_epoch existed, or by a tool that skips it.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO water_tests (date, ph, tank_id) VALUES ('2024-04-02T08:30:00', 6.9, 1)")
+    WaterTestRepository().save({"date": "2024-04-01T08:30:00", "ph": 7.1}, 1)
+
+    df = WaterTestRepository().fetch_by_date_range("2024-04-01T00:00:00", "2024-04-30T23:59:59", 1)
+    assert df["date"].dtype == "datetime64[ns]"
+    assert list(df["date"]) == [pd.Timestamp("2024-04-01T08:30:00"), pd.Timestamp("2024-04-02T08:30:00")]
+    assert list(df["ph"]) == [7.1, 6.9]
+    assert WaterTestRepository().fetch_by_date_range("2024-04-02T09:00:00", "2024-04-30T23:59:59", 1).empty
+
+
+def test_tank_update_sets_fields_in_one_statement(db_path, monkeypatch):
+    from aqualog_db import base
+    from aqualog_db.repositories.tank import TankRepository
+
+    init_tables()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE tanks SET updated_at = '2000-01-01 00:00:00' WHERE id = 1")
+
+    statements = []
+    def traced_checkout():
+        conn = connection.checkout_connection()
+        conn.set_trace_callback(statements.append)
+        return conn
+    monkeypatch.setattr(base, "checkout_connection", traced_checkout)
+
+    tank = TankRepository().update(1, name=" Reef ", volume_l=120, has_co2=0, co2_on_hour=8, co2_off_hour=None)
+    assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+    assert (tank["name"], tank["volume_l"], tank["has_co2"], tank["co2_on_hour"], tank["co2_off_hour"]) == (
+        "Reef", 120.0, 0, 8, None,
+    )
+    assert tank["updated_at"] != "2000-01-01 00:00:00"
+
+
+@pytest.mark.parametrize("fields", [
+    {"colour": "blue"},
+    {"name": "Reef", "id": 5},
+    {"co2_on_hour": True},
+    {"co2_off_hour": 7.5},
+    {"co2_on_hour": "8"},
+    {"co2_on_hour": 24},
+])
+def test_tank_update_rejects_unknown_fields_and_bad_hours(db_path, fields):
+    from aqualog_db.repositories.tank import TankRepository
+
+    init_tables()
+    with pytest.raises(ValueError):
+        TankRepository().update(1, **fields)
+    assert TankRepository().get_by_id(1)["name"] == "Default Tank"
+
+
+def test_save_accepts_missing_co2_indicator(db_path):
+    init_tables()
+    repo = WaterTestRepository()
+    # The water test form sends None for tanks without CO2.
+    repo.save({"date": "2024-05-01T09:00:00", "ph": 7.0, "co2_indicator": None}, 1)
+    repo.save({"date": "2024-05-02T09:00:00", "ph": 7.0, "co2_indicator": "Blue"}, 1)
+    with pytest.raises(ValueError):
+        repo.save({"date": "2024-05-03T09:00:00", "ph": 7.0, "co2_indicator": "Red"}, 1)
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT co2_indicator FROM water_tests ORDER BY date").fetchall() == [(None,), ("Blue",)]
+
+
+def test_daily_summary_follows_saves_deletes_and_tank_removal(db_path):
+    from aqualog_db.repositories.tank import TankRepository
+
+    init_tables()
+    shrimp = TankRepository().add("Shrimp")["id"]
+    repo = WaterTestRepository()
+    repo.save_many([
+        {"date": "2024-07-01T08:00:00", "ph": 7.0, "nitrate": 10},
+        {"date": "2024-07-01T20:00:00", "ph": 6.6, "nitrate": 20},
+        {"date": "2024-07-02T08:00:00", "ph": 7.2},
+    ], 1)
+    repo.save({"date": "2024-07-01T09:00:00", "ph": 7.8}, shrimp)
+
+    def summary(tank_id):
+        df = repo.fetch_daily_summary("2024-07-01", "2024-07-31", tank_id)
+        return [
+            (day.date().isoformat(), n, ph_avg, ph_min, ph_max, None if pd.isna(nitrate_max) else nitrate_max)
+            for day, n, ph_avg, ph_min, ph_max, nitrate_max
+            in df[["day", "n_tests", "ph_avg", "ph_min", "ph_max", "nitrate_max"]].itertuples(index=False)
+        ]
+
+    assert summary(1) == [
+        ("2024-07-01", 2, pytest.approx(6.8), 6.6, 7.0, 20.0),
+        ("2024-07-02", 1, 7.2, 7.2, 7.2, None),
+    ]
+    assert summary(shrimp) == [("2024-07-01", 1, 7.8, 7.8, 7.8, None)]
+
+    # Deleting a test recomputes its day, minimum and maximum included.
+    repo.execute("DELETE FROM water_tests WHERE tank_id = 1 AND ph = 6.6")
+    assert summary(1) == [
+        ("2024-07-01", 1, 7.0, 7.0, 7.0, 10.0),
+        ("2024-07-02", 1, 7.2, 7.2, 7.2, None),
+    ]
+    repo.execute("DELETE FROM water_tests WHERE tank_id = 1 AND ph = 7.2")
+    assert summary(1) == [("2024-07-01", 1, 7.0, 7.0, 7.0, 10.0)]
+
+    # Removing a tank drops its rollup rows with its tests.
+    TankRepository().remove(shrimp)
+    assert summary(shrimp) == []
+    assert summary(1) == [("2024-07-01", 1, 7.0, 7.0, 7.0, 10.0)]
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM water_tests_daily").fetchone()[0] == 1
+
+
+@pytest.mark.parametrize("start, end, tank_id, rows", [
+    ("2024-08-01T00:00:00", "2024-08-31T23:59:59", None, 6),
+    ("2024-08-01T00:00:00", "2024-08-31T23:59:59", 1, 5),
+    ("2024-08-02T00:00:00", "2024-08-02T23:59:59", 2, 1),
+    ("2025-01-01T00:00:00", "2025-01-31T23:59:59", 1, 0),
+])
+def test_fetch_by_date_range_arrays_matches_frame(db_path, start, end, tank_id, rows):
+    import numpy as np
+    from aqualog_db.repositories.tank import TankRepository
+
+    init_tables()
+    TankRepository().add("Shrimp")
+    repo = WaterTestRepository()
+    repo.save_many([
+        {"date": f"2024-08-0{day}T0{day}:00:00", "ph": 6.5 + day / 10, "nitrate": day if day % 2 else ""}
+        for day in range(1, 6)
+    ], 1)
+    repo.save_many([{"date": "2024-08-02T12:00:00", "ph": 7.4, "kh": 3}], 2)
+
+    df = repo.fetch_by_date_range(start, end, tank_id)
+    arrays = repo.fetch_by_date_range_arrays(start, end, tank_id)
+    assert len(df) == rows
+    assert set(arrays) == {"id", "tank_id", "date", *WaterTestRepository.PARAM_ORDER}
+    np.testing.assert_array_equal(arrays["id"], df["id"].to_numpy())
+    np.testing.assert_array_equal(arrays["tank_id"], df["tank_id"].to_numpy())
+    np.testing.assert_array_equal(arrays["date"], df["date"].to_numpy())
+    for field in WaterTestRepository.PARAM_ORDER:
+        np.testing.assert_array_equal(arrays[field], df[field].to_numpy())
@@ -25,4 +25,12 @@ def test_format_with_units():
     st.session_state['units'] = 'Metric'
     assert format_with_units(25.0, 'temperature') == '25.0 \u00b0C'
     st.session_state['units'] = 'Imperial'
-    assert format_with_units(25.0, 'temperature') == '77.0 \u00b0F'
\ No newline at end of file
+    assert format_with_units(25.0, 'temperature') == '77.0 \u00b0F'
+
+def test_format_series_with_units():
+    import pandas as pd
+    values = pd.Series([0.0, None, 25.0])
+    st.session_state['units'] = 'Imperial'
+    assert localization.format_series_with_units(values, 'temperature').tolist() == ['32.0 °F', 'N/A', '77.0 °F']
+    st.session_state['units'] = 'Metric'
+    assert localization.format_series_with_units(values, 'temperature').tolist() == ['0.0 °C', 'N/A', '25.0 °C']
@@ -10,12 +10,14 @@ from .localization import (
     translate,
     convert_value,
     format_with_units,
+    format_series_with_units,
 )
 from .validation import (
     validate_reading,
     is_too_low,
     is_too_high,
     is_out_of_range,
+    out_of_range_mask,
     arrow_safe,
 )
 from .chemistry import (
@@ -45,11 +47,13 @@ __all__ = [
     "translate",
     "convert_value",
     "format_with_units",
+    "format_series_with_units",
     # validation / df helpers
     "validate_reading",
     "is_too_low",
     "is_too_high",
     "is_out_of_range",
+    "out_of_range_mask",
     "arrow_safe",
     # chemistry
     "nh3_fraction",
@@ -11,7 +11,9 @@ displayed with appropriate units and translations.
 
 from __future__ import annotations # Added for type hinting consistency
 
+from functools import lru_cache
 from typing import Dict, Optional
+import pandas as pd
 import streamlit as st
 
 from config import LOCALIZATIONS, UNIT_SYSTEMS, CONVERSIONS
@@ -33,6 +35,14 @@ def translate(label: str) -> str:
     """
     # Get the current locale from Streamlit's session state, defaulting to 'en_US'.
     loc = st.session_state.get("locale", "en_US")
+    return _lookup_translation(loc, label)
+
+@lru_cache(maxsize=512)
+def _lookup_translation(loc: str, label: str) -> str:
+    """
+    Cached lookup behind `translate`. The locale rarely changes within a
+    session, so repeated labels are served from the cache on every rerun.
+    """
     # Look up the translation in the LOCALIZATIONS dictionary.
     # `.get(loc, {})` provides a safe fallback to an empty dict if locale is not found.
     # `.get(label, label)` provides the original label as a fallback if translation is missing.
@@ -45,7 +55,8 @@ def convert_value(value: float, param: str) -> float:
 
     It uses predefined unit symbols from `UNIT_SYSTEMS` and conversion functions
     from the `CONVERSIONS` dictionary (defined in `config.py`). The source unit
-    is always assumed to be Metric.
+    is always assumed to be Metric. `value` may also be a NumPy array or Pandas
+    Series, which is converted in one vectorized operation.
 
     Args:
         value (float): The numeric value to convert (expected in Metric units).
@@ -98,4 +109,24 @@ def format_with_units(value: float, param: str) -> str:
     
     # 3. Format the value to one decimal place and append the unit.
     # `.strip()` is used to remove leading/trailing whitespace if the unit string is empty.
-    return f"{v:.1f} {unit}".strip()
\ No newline at end of file
+    return f"{v:.1f} {unit}".strip()
+
+def format_series_with_units(values: pd.Series, param: str, missing: str = "N/A") -> pd.Series:
+    """
+    Column-wise counterpart of `format_with_units`. The whole column is
+    converted to the current unit system in one vectorized `convert_value`
+    call before the values are formatted.
+
+    Args:
+        values (pd.Series): Numeric values of `param`, in Metric units.
+        param (str): The name of the parameter.
+        missing (str): The text shown for missing values. Defaults to "N/A".
+
+    Returns:
+        pd.Series: The formatted strings (e.g., "25.0 °C"), aligned with `values`.
+    """
+    converted = convert_value(values, param)
+    unit = UNIT_SYSTEMS[st.session_state.get("units", "Metric")].get(param, "")
+    template = f"{{:.1f}} {unit}".strip()
+    return converted.map(template.format, na_action="ignore").where(values.notna(), missing)
+
@@ -12,7 +12,7 @@ from __future__ import annotations # Already present, ensuring consistency
 
 from typing import Optional, Any
 import streamlit as st
-from config import SAFE_RANGES, ACTION_PLANS, LOW_ACTION_PLANS
+from config import SAFE_RANGES, ACTION_PLANS, LOW_ACTION_PLANS, get_low_action_text, get_high_action_text
 
 # FIXED: Corrected the relative import paths for both validation and localization
 from ..validation import is_out_of_range
@@ -87,14 +87,12 @@ def _build_banner_details(param: str, value: float, low: float, high: float) ->
     """
     if value < low:
         # Get the action plan for too low values.
-        plan = LOW_ACTION_PLANS.get(param, ["No plan available."])
         return (f"- **{param.upper()}**: Too low ({format_with_units(value, param)} < "
-                f"{format_with_units(low, param)}); " + "; ".join(plan))
+                f"{format_with_units(low, param)}); " + get_low_action_text(param))
     
     # Get the action plan for too high values.
-    plan = ACTION_PLANS.get(param, ["No plan available."])
     return (f"- **{param.upper()}**: Too high ({format_with_units(value, param)} > "
-            f"{format_with_units(high, param)}); " + "; ".join(plan))
+            f"{format_with_units(high, param)}); " + get_high_action_text(param))
 
 
 def show_out_of_range_banner(*_args: Any, **_kwargs: Any) -> None:
@@ -10,9 +10,11 @@ values against safe limits, both global hard limits and user-defined custom rang
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from typing import Any, Optional, Tuple
 from config import SAFE_RANGES, TOO_LOW_THRESHOLDS, TOO_HIGH_THRESHOLDS, CO2_ON_SCHEDULE # Corrected import here
+from config import SAFE_RANGE_PARAMS, SAFE_RANGE_LOWS, SAFE_RANGE_HIGHS
 from datetime import time # Import time for comparison
 
 from .chemistry import nh3_fraction
@@ -106,6 +108,27 @@ def is_too_high(param: str, value: float) -> bool:
     thresh = TOO_HIGH_THRESHOLDS.get(param)
     return thresh is not None and value > thresh
 
+def out_of_range_mask(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Checks every `SAFE_RANGES` parameter column of a DataFrame against the
+    global safe ranges in one vectorized comparison.
+
+    Args:
+        df (pd.DataFrame): A DataFrame of water test readings. Values that cannot
+                           be coerced to numbers are treated as missing.
+
+    Returns:
+        pd.DataFrame: A boolean DataFrame with the same index as `df` and one column
+                      per `SAFE_RANGES` parameter present in `df`, True where the
+                      value is below the low or above the high bound. Missing
+                      values are never flagged.
+    """
+    present = [i for i, param in enumerate(SAFE_RANGE_PARAMS) if param in df.columns]
+    cols = [SAFE_RANGE_PARAMS[i] for i in present]
+    vals = df[cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    bad = (vals < SAFE_RANGE_LOWS[present]) | (vals > SAFE_RANGE_HIGHS[present])
+    return pd.DataFrame(bad, index=df.index, columns=cols)
+
 def is_out_of_range(
     param: str,
     value: Any,